@@ -4,13 +4,19 @@ YT Short Clipper Desktop App
 
 import customtkinter as ctk
 import threading
+import queue
+import importlib
 import json
 import os
 import sys
-import subprocess
 import re
+import time
 import urllib.request
-import io
+import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from email.utils import formatdate
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from openai import OpenAI
@@ -20,7 +26,7 @@ from PIL import Image, ImageTk
 from version import __version__, UPDATE_CHECK_URL
 
 # Import utilities
-from utils.helpers import get_app_dir, get_bundle_dir, get_ffmpeg_path, get_ytdlp_path, extract_video_id
+from utils.helpers import get_app_dir, get_bundle_dir, get_ffmpeg_path, get_ytdlp_path, extract_video_id, decode_jpeg, spawn_detached
 from utils.logger import debug_log, setup_error_logging, log_error, get_error_log_path
 from config.config_manager import ConfigManager
 from dialogs.model_selector import SearchableModelDropdown
@@ -53,6 +59,28 @@ ASSETS_DIR = BUNDLE_DIR / "assets"
 ICON_PATH = ASSETS_DIR / "icon.png"
 ICON_ICO_PATH = ASSETS_DIR / "icon.ico"
 COOKIES_FILE = APP_DIR / "cookies.txt"  # NEW: Cookies file path
+THUMB_CACHE_DIR = OUTPUT_DIR / "_thumb_cache"
+THUMB_CACHE_MAX_AGE = 7 * 24 * 3600  # Revalidate cached thumbnails after a week
+THUMB_CACHE_PRUNE_AGE = 30 * 24 * 3600  # Delete cached thumbnails untouched for a month
+THUMB_MEM_CACHE_SIZE = 32  # Preview images kept in memory for quick switching back
+THUMB_PREVIEW_SIZE = (390, 220)  # Fits the 400x225 preview frame
+UI_QUEUE_INTERVAL_MS = 33  # ~30Hz refresh for processing updates
+URL_DEBOUNCE_MS = 250  # Delay before a changed URL triggers thumbnail/subtitle fetches
+
+# Keep-alive session so repeated thumbnail requests reuse one TLS connection
+_thumb_session = requests.Session()
+
+
+# Progress status parsing: (51%) or 51.2% or 51%, and "Clip 2/5"
+_PROGRESS_RE = re.compile(r'\((\d+(?:\.\d+)?)%\)|(\d+(?:\.\d+)?)%')
+_CLIP_RE = re.compile(r'Clip (\d+)/(\d+)')
+
+# Label shown on each progress step once processing has moved past it
+_STEP_DONE_TEXT = ("Downloaded", "Found highlights", "Complete")
+
+# Status keyword -> progress step index (3 = all steps complete); lower index wins
+_STEP_RE = re.compile(r'\b(download|highlight|finding|clip|clean|complete)\w*', re.IGNORECASE)
+_STEP_INDEX = {"download": 0, "highlight": 1, "finding": 1, "clip": 2, "clean": 2, "complete": 3}
 
 
 class YTShortClipperApp(ctk.CTk):
@@ -62,6 +90,14 @@ class YTShortClipperApp(ctk.CTk):
         self.config = ConfigManager(CONFIG_FILE, OUTPUT_DIR)
         self.client = None
         self.current_thumbnail = None
+        self._thumb_mem_cache = OrderedDict()  # video_id -> CTkImage of the resized thumbnail (LRU)
+        try:
+            self._thumb_cache_names = set(os.listdir(THUMB_CACHE_DIR))  # Files in the disk cache
+        except OSError:
+            self._thumb_cache_names = set()
+        self._thumb_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="thumb")
+        self._url_debounce_id = None
+        self._last_resolved_video_id = None
         self.processing = False
         self.cancelled = False
         self.token_usage = {"gpt_input": 0, "gpt_output": 0, "whisper_seconds": 0, "tts_chars": 0}
@@ -69,6 +105,9 @@ class YTShortClipperApp(ctk.CTk):
         self.youtube_channel = None
         self.ytdlp_path = get_ytdlp_path()  # NEW: Store yt-dlp path for subtitle fetching
         self.cookies_path = COOKIES_FILE  # NEW: Store cookies path
+        self._ui_queue = queue.Queue()  # Worker -> UI updates, drained by _drain_ui_queue
+        self._ui_drain_lock = threading.Lock()
+        self._ui_drain_scheduled = False  # A drain is pending for the items in _ui_queue
         
         self.title("YT Short Clipper")
         self.geometry("780x620")
@@ -87,11 +126,15 @@ class YTShortClipperApp(ctk.CTk):
         self.create_home_page()
         self.create_processing_page()
         self.create_results_page()
-        self.create_browse_page()
-        self.create_settings_page()
-        self.create_api_status_page()
-        self.create_lib_status_page()
-        self.create_contact_page()
+        
+        # Secondary pages are built on first navigation (see show_page)
+        self._page_builders = {
+            "browse": self.create_browse_page,
+            "settings": self.create_settings_page,
+            "api_status": self.create_api_status_page,
+            "lib_status": self.create_lib_status_page,
+            "contact": self.create_contact_page,
+        }
         
         self.show_page("home")
         self.load_config()
@@ -102,6 +145,33 @@ class YTShortClipperApp(ctk.CTk):
         
         # Check for updates on startup
         threading.Thread(target=self.check_update_silent, daemon=True).start()
+        
+        # Load heavy modules in the background while the user enters a URL
+        threading.Thread(target=self._warm_imports, daemon=True).start()
+    
+    def _warm_imports(self):
+        """Import slow modules ahead of first use"""
+        for name in ("clipper_core", "youtube_uploader"):
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                debug_log(f"Background import of {name} skipped: {e}")
+        self._prune_thumb_cache()
+    
+    def _prune_thumb_cache(self):
+        """Delete disk-cached YouTube thumbnails that haven't been used for a while"""
+        cutoff = time.time() - THUMB_CACHE_PRUNE_AGE
+        try:
+            with os.scandir(THUMB_CACHE_DIR) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                            self._thumb_cache_names.discard(entry.name)
+                    except OSError:
+                        pass  # In use or already gone - try again next launch
+        except OSError:
+            pass  # No cache directory yet
     
     def set_app_icon(self):
         """Set window icon"""
@@ -126,6 +196,9 @@ class YTShortClipperApp(ctk.CTk):
             print(f"Icon error: {e}")
     
     def show_page(self, name):
+        if name not in self.pages:
+            self._page_builders[name]()
+        
         for page in self.pages.values():
             page.pack_forget()
         self.pages[name].pack(fill="both", expand=True)
@@ -150,6 +223,7 @@ class YTShortClipperApp(ctk.CTk):
         """Reset home page to initial state"""
         # Clear URL input
         self.url_var.set("")
+        self._last_resolved_video_id = None
         
         # Reset thumbnail - recreate preview placeholder
         self.current_thumbnail = None
@@ -189,11 +263,11 @@ class YTShortClipperApp(ctk.CTk):
         # Load icons for buttons
         try:
             play_img = Image.open(ASSETS_DIR / "play.png")
-            play_img.thumbnail((20, 20), Image.Resampling.LANCZOS)
+            play_img.thumbnail((20, 20), Image.Resampling.LANCZOS, reducing_gap=3.0)
             self.play_icon = ctk.CTkImage(light_image=play_img, dark_image=play_img, size=(20, 20))
             
             refresh_img = Image.open(ASSETS_DIR / "refresh.png")
-            refresh_img.thumbnail((20, 20), Image.Resampling.LANCZOS)
+            refresh_img.thumbnail((20, 20), Image.Resampling.LANCZOS, reducing_gap=3.0)
             self.refresh_icon = ctk.CTkImage(light_image=refresh_img, dark_image=refresh_img, size=(20, 20))
         except Exception as e:
             debug_log(f"Icon load error: {e}")
@@ -639,6 +713,7 @@ class YTShortClipperApp(ctk.CTk):
         )
         # Keep reference to steps for update_progress
         self.steps = self.pages["processing"].steps
+        self._active_step_idx = -1
     
     def create_results_page(self):
         """Create results page as embedded frame"""
@@ -713,7 +788,8 @@ class YTShortClipperApp(ctk.CTk):
                 if hasattr(self, 'api_dot'):
                     self.api_dot.configure(text_color="#27ae60")  # Green
                     self.api_status_label.configure(text=model[:15] if model else "Connected")
-            except:
+            except Exception:
+                # Client construction failed (bad key/URL) - not a reason to abort startup
                 if hasattr(self, 'api_dot'):
                     self.api_dot.configure(text_color="#e74c3c")  # Red
                     self.api_status_label.configure(text="Invalid key")
@@ -747,7 +823,8 @@ class YTShortClipperApp(ctk.CTk):
             if hasattr(self, 'yt_dot'):
                 self.yt_dot.configure(text_color="#e74c3c")  # Red
                 self.yt_status_label_home.configure(text="Not connected")
-        except:
+        except Exception:
+            # Missing Google libs or network/auth failure - treat as unavailable
             self.youtube_connected = False
             if hasattr(self, 'yt_dot'):
                 self.yt_dot.configure(text_color="#e74c3c")  # Red
@@ -789,8 +866,21 @@ class YTShortClipperApp(ctk.CTk):
             return self.client
     
     def on_url_change(self, *args):
+        # Wait for typing/pasting to settle before fetching anything
+        if self._url_debounce_id is not None:
+            self.after_cancel(self._url_debounce_id)
+        if extract_video_id(self.url_var.get().strip()) != self._last_resolved_video_id:
+            self.start_btn.configure(state="disabled", fg_color="gray", hover_color="gray")
+        self._url_debounce_id = self.after(URL_DEBOUNCE_MS, self._do_url_change)
+    
+    def _do_url_change(self):
+        self._url_debounce_id = None
         url = self.url_var.get().strip()
         video_id = extract_video_id(url)
+        if video_id and video_id == self._last_resolved_video_id:
+            self.update_start_button_state()
+            return
+        self._last_resolved_video_id = video_id
         if video_id:
             # Reset subtitle loaded flag when URL changes
             self.subtitle_loaded = False
@@ -1001,49 +1091,43 @@ class YTShortClipperApp(ctk.CTk):
     def load_thumbnail(self, video_id: str):
         def fetch():
             try:
-                import ssl
-                import certifi
-                
-                # Try with certifi first, fallback to unverified SSL
-                ssl_context = None
-                try:
-                    ssl_context = ssl.create_default_context(cafile=certifi.where())
-                except Exception:
-                    pass
-                
-                if ssl_context is None:
-                    # Fallback to unverified SSL (for PyInstaller builds)
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
+                # Request every quality at once, then take the best usable one
+                qualities = ["maxresdefault", "hqdefault", "mqdefault"]
+                futures = {quality: self._thumb_pool.submit(self._fetch_thumbnail_image, video_id, quality)
+                    for quality in qualities}
                 
                 img = None
-                for quality in ["maxresdefault", "hqdefault", "mqdefault"]:
+                for quality in qualities:
                     try:
-                        url = f"https://img.youtube.com/vi/{video_id}/{quality}.jpg"
-                        with urllib.request.urlopen(url, timeout=5, context=ssl_context) as r:
-                            data = r.read()
-                        img = Image.open(io.BytesIO(data))
+                        img = futures[quality].result()
                         if img.size[0] > 120:
                             break
-                    except Exception as e:
+                    except (OSError, ValueError) as e:
+                        # HTTP errors, timeouts and undecodable images
                         debug_log(f"Thumbnail fetch error ({quality}): {e}")
                         continue
                 
+                for future in futures.values():
+                    future.cancel()
+                
                 if img is None:
-                    raise Exception("All thumbnail qualities failed")
+                    raise OSError("All thumbnail qualities failed")
                     
                 # Resize to fit preview area in landscape (16:9 aspect ratio)
                 # Frame is 400x225
-                img.thumbnail((390, 220), Image.Resampling.LANCZOS)
-                self.after(0, lambda: self.show_thumbnail(img))
-            except Exception as e:
+                img.thumbnail(THUMB_PREVIEW_SIZE, Image.Resampling.LANCZOS, reducing_gap=3.0)
+                self.after(0, lambda: self.show_thumbnail(img, video_id))
+            except (OSError, ValueError) as e:
                 debug_log(f"Thumbnail load failed: {e}")
                 self.after(0, lambda: self.on_thumbnail_error())
         
         # Clear image reference properly before loading new one
         self.current_thumbnail = None
         
+        if video_id in self._thumb_mem_cache:
+            self.show_thumbnail(None, video_id)
+            return
+        
         # Show loading state
         for widget in self.thumb_frame.winfo_children():
             widget.destroy()
@@ -1058,9 +1142,45 @@ class YTShortClipperApp(ctk.CTk):
         self.start_btn.configure(state="disabled", fg_color="gray", hover_color="gray")
         threading.Thread(target=fetch, daemon=True).start()
     
+    def _fetch_thumbnail_image(self, video_id: str, quality: str):
+        """Get a YouTube thumbnail, using the on-disk cache when it is fresh"""
+        cache_name = f"{video_id}_{quality}.jpg"
+        cache_path = THUMB_CACHE_DIR / cache_name
+        headers = {}
+        mtime = None
+        if cache_name in self._thumb_cache_names:
+            try:
+                mtime = cache_path.stat().st_mtime
+            except OSError:
+                self._thumb_cache_names.discard(cache_name)
+        
+        if mtime is not None:
+            if time.time() - mtime < THUMB_CACHE_MAX_AGE:
+                return decode_jpeg(cache_path.read_bytes(), THUMB_PREVIEW_SIZE)
+            headers["If-Modified-Since"] = formatdate(mtime, usegmt=True)
+        
+        url = f"https://img.youtube.com/vi/{video_id}/{quality}.jpg"
+        response = _thumb_session.get(url, headers=headers, timeout=5)
+        if response.status_code == 304 and mtime is not None:
+            # Not modified - keep the cached copy for another week
+            os.utime(cache_path)
+            return decode_jpeg(cache_path.read_bytes(), THUMB_PREVIEW_SIZE)
+        response.raise_for_status()
+        
+        img = decode_jpeg(response.content, THUMB_PREVIEW_SIZE)
+        try:
+            THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(response.content)
+            self._thumb_cache_names.add(cache_name)
+        except OSError as e:
+            debug_log(f"Thumbnail cache write failed: {e}")
+        return img
+    
     def on_thumbnail_error(self):
         # Clear image reference properly before showing error
         self.current_thumbnail = None
+        # Let the same URL be retried instead of being skipped as already resolved
+        self._last_resolved_video_id = None
         # Recreate placeholder with error message
         for widget in self.thumb_frame.winfo_children():
             widget.destroy()
@@ -1075,14 +1195,22 @@ class YTShortClipperApp(ctk.CTk):
         
         self.start_btn.configure(state="disabled", fg_color="gray", hover_color="gray")
     
-    def show_thumbnail(self, img):
+    def show_thumbnail(self, img, video_id=None):
         try:
             # Clear the preview container and show thumbnail
             for widget in self.thumb_frame.winfo_children():
                 widget.destroy()
             
-            # Create image with proper size
-            ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+            # Create image with proper size, reusing one built for this video before
+            ctk_img = self._thumb_mem_cache.get(video_id)
+            if ctk_img is None:
+                ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+                if video_id:
+                    self._thumb_mem_cache[video_id] = ctk_img
+                    if len(self._thumb_mem_cache) > THUMB_MEM_CACHE_SIZE:
+                        self._thumb_mem_cache.popitem(last=False)
+            else:
+                self._thumb_mem_cache.move_to_end(video_id)
             self.current_thumbnail = ctk_img
             
             # Show thumbnail centered
@@ -1259,7 +1387,7 @@ class YTShortClipperApp(ctk.CTk):
             num_clips = int(self.clips_var.get())
             if not 1 <= num_clips <= 10:
                 raise ValueError()
-        except:
+        except (ValueError, TypeError):
             messagebox.showerror("Error", "Clips must be 1-10!")
             return
         
@@ -1278,6 +1406,7 @@ class YTShortClipperApp(ctk.CTk):
         
         # Reset processing page UI
         self.pages["processing"].reset_ui()
+        self._active_step_idx = -1
         
         self.show_page("processing")
         
@@ -1293,7 +1422,7 @@ class YTShortClipperApp(ctk.CTk):
             # Wrapper for log callback that also logs to console in debug mode
             def log_with_debug(msg):
                 debug_log(msg)
-                self.after(0, lambda: self.update_status(msg))
+                self._post_ui("status", msg)
             
             # Get system prompt from config
             # Priority: ai_providers.highlight_finder.system_message > root system_prompt
@@ -1332,8 +1461,8 @@ class YTShortClipperApp(ctk.CTk):
                 ai_providers=self.config.get("ai_providers"),
                 subtitle_language=subtitle_lang,
                 log_callback=log_with_debug,
-                progress_callback=lambda s, p: self.after(0, lambda: self.update_progress(s, p)),
-                token_callback=lambda a, b, c, d: self.after(0, lambda: self.update_tokens(a, b, c, d)),
+                progress_callback=lambda s, p: self._post_ui("progress", (s, p)),
+                token_callback=lambda a, b, c, d: self._post_ui("tokens", (a, b, c, d)),
                 cancel_check=lambda: self.cancelled
             )
             
@@ -1344,7 +1473,7 @@ class YTShortClipperApp(ctk.CTk):
             
             core.process(url, num_clips, add_captions=add_captions, add_hook=add_hook)
             if not self.cancelled:
-                self.after(0, self.on_complete)
+                self._post_ui("call", self.on_complete)
         except Exception as e:
             error_msg = str(e)
             debug_log(f"ERROR: {error_msg}")
@@ -1353,10 +1482,59 @@ class YTShortClipperApp(ctk.CTk):
             log_error(f"Processing failed for URL: {url}", e)
             
             if self.cancelled or "cancel" in error_msg.lower():
-                self.after(0, self.on_cancelled)
+                self._post_ui("call", self.on_cancelled)
             else:
-                self.after(0, lambda: self.on_error(error_msg))
+                self._post_ui("call", lambda: self.on_error(error_msg))
 
+    def _post_ui(self, key, value):
+        """Queue a worker update, scheduling a drain only if none is pending"""
+        self._ui_queue.put((key, value))
+        with self._ui_drain_lock:
+            if self._ui_drain_scheduled:
+                return
+            self._ui_drain_scheduled = True
+        # Updates arriving within the interval are coalesced into one drain
+        self.after(UI_QUEUE_INTERVAL_MS, self._drain_ui_queue)
+    
+    def _drain_ui_queue(self):
+        """Apply queued worker updates, keeping only the latest status/progress"""
+        with self._ui_drain_lock:
+            self._ui_drain_scheduled = False
+        pending = {}
+        tokens = None
+        calls = []
+        try:
+            while True:
+                key, value = self._ui_queue.get_nowait()
+                if key == "tokens":
+                    # Token counts are deltas, so sum them instead of dropping any
+                    tokens = value if tokens is None else tuple(a + b for a, b in zip(tokens, value))
+                elif key == "call":
+                    calls.append(value)
+                else:
+                    # Re-insert so the dict keeps arrival order of the latest values
+                    pending.pop(key, None)
+                    pending[key] = value
+        except queue.Empty:
+            pass
+        
+        updates = []
+        for key, value in pending.items():
+            if key == "status":
+                updates.append(partial(self.update_status, value))
+            elif key == "progress":
+                updates.append(partial(self.update_progress, *value))
+        if tokens is not None:
+            updates.append(partial(self.update_tokens, *tokens))
+        updates.extend(calls)
+        
+        # One failing update must not drop the rest of the batch
+        for update in updates:
+            try:
+                update()
+            except Exception as e:
+                log_error("UI update failed", e)
+    
     def update_status(self, msg):
         self.pages["processing"].update_status(msg)
     
@@ -1364,12 +1542,9 @@ class YTShortClipperApp(ctk.CTk):
         print(f"[DEBUG] update_progress called: status='{status}', progress={progress}")
         self.pages["processing"].update_status(status)
         
-        # Update step indicators based on status text
-        status_lower = status.lower()
-        
         # Parse progress percentage from status if available
         # Try multiple formats: (51%) or 51.2% or 51%
-        progress_match = re.search(r'\((\d+(?:\.\d+)?)%\)|(\d+(?:\.\d+)?)%', status)
+        progress_match = _PROGRESS_RE.search(status)
         if progress_match:
             # Get the first non-None group
             step_progress = float(progress_match.group(1) or progress_match.group(2)) / 100
@@ -1378,34 +1553,45 @@ class YTShortClipperApp(ctk.CTk):
         
         print(f"[DEBUG] Parsed step_progress: {step_progress}")
         
-        if "download" in status_lower:
+        # Update step indicators; when several keywords appear the earliest step wins,
+        # e.g. "Cleaning up download cache" is still the download step
+        step = min((_STEP_INDEX[m.group(1).lower()] for m in _STEP_RE.finditer(status)), default=None)
+        if step is None:
+            return
+        
+        if step == 0:
             if step_progress is None:
                 step_progress = 0.0
-            self.steps[0].set_active(status, step_progress)
-            self.steps[1].reset()
-            self.steps[2].reset()
-        elif "highlight" in status_lower or "finding" in status_lower:
-            self.steps[0].set_done("Downloaded")
-            self.steps[1].set_active(status, step_progress)
-            self.steps[2].reset()
-        elif "clip" in status_lower or "clean" in status_lower:
-            self.steps[0].set_done("Downloaded")
-            self.steps[1].set_done("Found highlights")
-            
+            self._activate_step(0, status, step_progress)
+        elif step == 1:
+            self._activate_step(1, status, step_progress)
+        elif step == 2:
             if step_progress is None:
                 step_progress = 0.0
             
             # Extract clip number to show progress
-            match = re.search(r'Clip (\d+)/(\d+)', status)
+            match = _CLIP_RE.search(status)
             if match:
                 current, total = int(match.group(1)), int(match.group(2))
                 percent = current / total
-                self.steps[2].set_active(f"Clip {current}/{total}", percent)
+                self._activate_step(2, f"Clip {current}/{total}", percent)
             else:
-                self.steps[2].set_active(status, step_progress)
-        elif "complete" in status_lower:
-            for step in self.steps:
-                step.set_done("Complete")
+                self._activate_step(2, status, step_progress)
+        else:
+            for progress_step in self.steps:
+                progress_step.set_done("Complete")
+            self._active_step_idx = -1
+    
+    def _activate_step(self, idx, text, progress):
+        """Activate steps[idx], restyling the other steps only when the active step changes"""
+        if idx != self._active_step_idx:
+            for i, step in enumerate(self.steps):
+                if i < idx:
+                    step.set_done(_STEP_DONE_TEXT[i])
+                elif i > idx:
+                    step.reset()
+            self._active_step_idx = idx
+        self.steps[idx].set_active(text, progress)
     
     def update_tokens(self, gpt_in, gpt_out, whisper, tts):
         self.token_usage["gpt_input"] += gpt_in
@@ -1450,7 +1636,7 @@ class YTShortClipperApp(ctk.CTk):
         if sys.platform == "win32":
             os.startfile(output_dir)
         else:
-            subprocess.run(["open" if sys.platform == "darwin" else "xdg-open", output_dir])
+            spawn_detached(["open" if sys.platform == "darwin" else "xdg-open", output_dir])
     
     def open_discord(self):
         """Open Discord server invite link"""
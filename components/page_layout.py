@@ -8,6 +8,18 @@ from PIL import Image
 from datetime import datetime
 
 
+_FONTS = {}
+
+
+def shared_font(size, weight="normal"):
+    """Get a CTkFont shared by every widget using the same size/weight"""
+    key = (size, weight)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
 class PageHeader(ctk.CTkFrame):
     """Reusable header component with logo, title, and navigation buttons"""
     
@@ -31,7 +43,7 @@ class PageHeader(ctk.CTkFrame):
             ctk.CTkButton(left_frame, text="←", width=40, fg_color="transparent", 
                 hover_color=("gray75", "gray25"), 
                 command=self.app.on_back if hasattr(self.app, 'on_back') else lambda: self.app.show_page("home")).pack(side="left")
-            ctk.CTkLabel(left_frame, text=self.page_title, font=ctk.CTkFont(size=22, weight="bold")).pack(side="left", padx=10)
+            ctk.CTkLabel(left_frame, text=self.page_title, font=shared_font(22, "bold")).pack(side="left", padx=10)
             
             # Right side: Logo + tagline
             right_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -46,7 +58,7 @@ class PageHeader(ctk.CTkFrame):
                 
                 if ICON_PATH.exists():
                     icon_img = Image.open(ICON_PATH)
-                    icon_img.thumbnail((32, 32), Image.Resampling.LANCZOS)
+                    icon_img.thumbnail((32, 32), Image.Resampling.LANCZOS, reducing_gap=3.0)
                     header_icon = ctk.CTkImage(light_image=icon_img, dark_image=icon_img, size=(32, 32))
                     ctk.CTkLabel(right_frame, image=header_icon, text="").pack(side="left", padx=(0, 10))
                     # Keep reference to prevent garbage collection
@@ -56,9 +68,9 @@ class PageHeader(ctk.CTkFrame):
             
             tagline_col = ctk.CTkFrame(right_frame, fg_color="transparent")
             tagline_col.pack(side="left")
-            ctk.CTkLabel(tagline_col, text="YT Short Clipper", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w")
+            ctk.CTkLabel(tagline_col, text="YT Short Clipper", font=shared_font(14, "bold")).pack(anchor="w")
             ctk.CTkLabel(tagline_col, text="Turn long YouTube videos into viral shorts — Powered by AI", 
-                font=ctk.CTkFont(size=9), text_color="gray").pack(anchor="w")
+                font=shared_font(9), text_color="gray").pack(anchor="w")
             return
         
         # Normal mode: App icon + title on left
@@ -74,7 +86,7 @@ class PageHeader(ctk.CTkFrame):
             
             if ICON_PATH.exists():
                 icon_img = Image.open(ICON_PATH)
-                icon_img.thumbnail((40, 40), Image.Resampling.LANCZOS)
+                icon_img.thumbnail((40, 40), Image.Resampling.LANCZOS, reducing_gap=3.0)
                 header_icon = ctk.CTkImage(light_image=icon_img, dark_image=icon_img, size=(40, 40))
                 ctk.CTkLabel(title_frame, image=header_icon, text="").pack(side="left", padx=(0, 12))
                 # Keep reference to prevent garbage collection
@@ -100,15 +112,15 @@ class PageHeader(ctk.CTkFrame):
                 ASSETS_DIR = BUNDLE_DIR / "assets"
                 
                 settings_img = Image.open(ASSETS_DIR / "settings.png")
-                settings_img.thumbnail((18, 18), Image.Resampling.LANCZOS)
+                settings_img.thumbnail((18, 18), Image.Resampling.LANCZOS, reducing_gap=3.0)
                 settings_icon = ctk.CTkImage(light_image=settings_img, dark_image=settings_img, size=(18, 18))
                 
                 api_img = Image.open(ASSETS_DIR / "api-status.png")
-                api_img.thumbnail((18, 18), Image.Resampling.LANCZOS)
+                api_img.thumbnail((18, 18), Image.Resampling.LANCZOS, reducing_gap=3.0)
                 api_icon = ctk.CTkImage(light_image=api_img, dark_image=api_img, size=(18, 18))
                 
                 lib_img = Image.open(ASSETS_DIR / "lib-status.png")
-                lib_img.thumbnail((18, 18), Image.Resampling.LANCZOS)
+                lib_img.thumbnail((18, 18), Image.Resampling.LANCZOS, reducing_gap=3.0)
                 lib_icon = ctk.CTkImage(light_image=lib_img, dark_image=lib_img, size=(18, 18))
                 
                 # Keep references
@@ -10,6 +10,8 @@ from tkinter import messagebox
 from pathlib import Path
 from PIL import Image
 
+COUNT_DEBOUNCE_MS = 120  # Idle time after a keystroke before recounting the description
+
 
 class YouTubeUploadDialog(ctk.CTkToplevel):
     """Dialog for uploading video to YouTube with SEO metadata"""
@@ -21,6 +23,7 @@ class YouTubeUploadDialog(ctk.CTkToplevel):
         self.model = model
         self.temperature = temperature
         self.uploading = False
+        self._desc_count_after = None
         
         self.title("Upload to YouTube")
         self.geometry("550x700")
@@ -100,7 +103,7 @@ class YouTubeUploadDialog(ctk.CTkToplevel):
         self.desc_count = ctk.CTkLabel(scroll_frame, text="0/5000", 
             text_color="gray", anchor="e")
         self.desc_count.pack(fill="x")
-        self.desc_text.bind("<KeyRelease>", self.update_desc_count)
+        self.desc_text.bind("<KeyRelease>", self._schedule_desc_count)
         
         # Privacy
         privacy_frame = ctk.CTkFrame(scroll_frame, fg_color="transparent")
@@ -148,7 +151,7 @@ class YouTubeUploadDialog(ctk.CTkToplevel):
         
         # Generate button
         self.generate_btn = ctk.CTkButton(scroll_frame, text="🔄 Regenerate SEO", 
-            height=35, fg_color="gray", command=self.generate_seo_metadata)
+            height=35, fg_color="gray", command=lambda: self.generate_seo_metadata(use_cache=False))
         self.generate_btn.pack(fill="x", pady=(10, 0))
         
         # Progress (outside scroll)
@@ -190,13 +193,20 @@ class YouTubeUploadDialog(ctk.CTkToplevel):
         color = "red" if count > 100 else "gray"
         self.title_count.configure(text=f"{count}/100", text_color=color)
     
+    def _schedule_desc_count(self, event=None):
+        """Recount the description once typing pauses"""
+        if self._desc_count_after is not None:
+            self.after_cancel(self._desc_count_after)
+        self._desc_count_after = self.after(COUNT_DEBOUNCE_MS, self.update_desc_count)
+    
     def update_desc_count(self, event=None):
         """Update description character count"""
+        self._desc_count_after = None
         count = len(self.desc_text.get("1.0", "end-1c"))
         color = "red" if count > 5000 else "gray"
         self.desc_count.configure(text=f"{count}/5000", text_color=color)
     
-    def generate_seo_metadata(self):
+    def generate_seo_metadata(self, use_cache=True):
         """Generate SEO-optimized title and description using GPT"""
         self.generate_btn.configure(state="disabled", text="Generating...")
         self.title_entry.delete(0, "end")
@@ -212,7 +222,8 @@ class YouTubeUploadDialog(ctk.CTkToplevel):
                     self.clip['title'],
                     self.clip['hook_text'],
                     self.model,
-                    self.temperature
+                    self.temperature,
+                    use_cache=use_cache
                 )
                 self.after(0, lambda: self.set_metadata(metadata))
             except Exception as e:
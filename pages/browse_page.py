@@ -7,13 +7,30 @@ import sys
 import json
 import threading
 import subprocess
+import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import customtkinter as ctk
 from pathlib import Path
 from tkinter import messagebox
 from PIL import Image
-import cv2
 
+from components.page_layout import shared_font
 from dialogs.youtube_upload import YouTubeUploadDialog
+from utils.helpers import CLIP_THUMB_NAME, load_clip_thumbnail, spawn_detached
+from utils.logger import debug_log
+
+# Parse data.json with orjson when it is installed (parses UTF-8 bytes directly)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+DATA_CACHE_SIZE = 500  # Parsed data.json files kept between refreshes
+RENDER_BATCH_SIZE = 5  # Rows built per idle callback
+REFRESH_DEBOUNCE_MS = 250  # Window for coalescing repeated Refresh clicks
 
 
 class BrowsePage(ctk.CTkFrame):
@@ -27,56 +44,34 @@ class BrowsePage(ctk.CTkFrame):
         self.on_back = on_back_callback
         self.refresh_icon = refresh_icon
         
-        self.browse_thumbnails = []
+        self.browse_thumbnails = {}  # master.mp4 path -> CTkImage
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="browse")
+        self._thumb_futures = []  # Pending thumbnail jobs from the current refresh
+        self._pending_thumbs = []  # (video path, thumb frame, row, thumb_fresh) not yet scrolled near
+        self._visible_check_id = None
+        self._render_gen_id = 0
+        self._refresh_after_id = None
+        self._data_cache = OrderedDict()  # data.json path -> (mtime_ns, parsed data)
+        self._data_cache_lock = threading.Lock()
         
         self.create_ui()
     
+    def destroy(self):
+        """Stop pending background work before destroying the page"""
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+    
     def create_ui(self):
         """Create the browse page UI"""
-        # Import footer component
-        from components.page_layout import PageFooter
+        # Import header and footer components
+        from components.page_layout import PageHeader, PageFooter
         
         # Set background color to match home page
         self.configure(fg_color=("#1a1a1a", "#0a0a0a"))
         
         # Header with back button
-        header_frame = ctk.CTkFrame(self, fg_color="transparent")
-        header_frame.pack(fill="x", padx=20, pady=(15, 10))
-        
-        # Left side: Back button + title
-        left_header = ctk.CTkFrame(header_frame, fg_color="transparent")
-        left_header.pack(side="left")
-        
-        ctk.CTkButton(left_header, text="←", width=40, fg_color="transparent", 
-            hover_color=("gray75", "gray25"), command=self.on_back).pack(side="left")
-        ctk.CTkLabel(left_header, text="Browse Videos", font=ctk.CTkFont(size=22, weight="bold")).pack(side="left", padx=10)
-        
-        # Right side: Logo + tagline
-        right_header = ctk.CTkFrame(header_frame, fg_color="transparent")
-        right_header.pack(side="right")
-        
-        # Logo + tagline
-        try:
-            from utils.helpers import get_bundle_dir
-            BUNDLE_DIR = get_bundle_dir()
-            ASSETS_DIR = BUNDLE_DIR / "assets"
-            ICON_PATH = ASSETS_DIR / "icon.png"
-            
-            if ICON_PATH.exists():
-                icon_img = Image.open(ICON_PATH)
-                icon_img.thumbnail((32, 32), Image.Resampling.LANCZOS)
-                header_icon = ctk.CTkImage(light_image=icon_img, dark_image=icon_img, size=(32, 32))
-                ctk.CTkLabel(right_header, image=header_icon, text="").pack(side="left", padx=(0, 10))
-                # Keep reference
-                self.header_icon = header_icon
-        except:
-            pass
-        
-        tagline_col = ctk.CTkFrame(right_header, fg_color="transparent")
-        tagline_col.pack(side="left")
-        ctk.CTkLabel(tagline_col, text="YT Short Clipper", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w")
-        ctk.CTkLabel(tagline_col, text="Turn long YouTube videos into viral shorts — Powered by AI", 
-            font=ctk.CTkFont(size=9), text_color="gray").pack(anchor="w")
+        header = PageHeader(self, self, show_nav_buttons=False, show_back_button=True, page_title="Browse Videos")
+        header.pack(fill="x", padx=20, pady=(15, 10))
         
         # Main content
         main = ctk.CTkFrame(self, fg_color="transparent")
@@ -85,13 +80,23 @@ class BrowsePage(ctk.CTkFrame):
         # Video list (scrollable) - full height
         self.list_frame = ctk.CTkScrollableFrame(main)
         self.list_frame.pack(fill="both", expand=True, pady=(10, 10))
+        # Hear about every scroll/resize so thumbnails load as rows come into view.
+        # CTkScrollableFrame has no public hook for this, so it relies on the private
+        # _parent_canvas/_scrollbar internals; if a CTk release renames them, every
+        # thumbnail is simply loaded up front instead.
+        self._list_canvas = getattr(self.list_frame, "_parent_canvas", None)
+        self._list_scrollbar = getattr(self.list_frame, "_scrollbar", None)
+        if self._list_canvas is not None and self._list_scrollbar is not None:
+            self._list_canvas.configure(yscrollcommand=self._on_list_scroll)
+        else:
+            self._list_canvas = None
         
         # Bottom buttons
         btn_frame = ctk.CTkFrame(main, fg_color="transparent")
         btn_frame.pack(fill="x", side="bottom")
         
         self.refresh_btn = ctk.CTkButton(btn_frame, text="🔄 Refresh", height=45, image=self.refresh_icon, compound="left",
-            font=ctk.CTkFont(size=13), command=self.refresh_list)
+            font=ctk.CTkFont(size=13), command=self._schedule_refresh)
         self.refresh_btn.pack(side="left", fill="x", expand=True, padx=(0, 5))
         
         self.folder_btn = ctk.CTkButton(btn_frame, text="📂 Open Output Folder", height=45,
@@ -102,143 +107,272 @@ class BrowsePage(ctk.CTkFrame):
         footer = PageFooter(self, self)
         footer.pack(fill="x", padx=20, pady=(10, 15))
     
+    def _schedule_refresh(self):
+        """Coalesce rapid Refresh clicks into a single refresh"""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(REFRESH_DEBOUNCE_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run the debounced refresh"""
+        self._refresh_after_id = None
+        self.refresh_list()
+    
     def refresh_list(self):
         """Refresh the list of videos in output folder"""
+        if self._refresh_after_id is not None:
+            # A direct refresh supersedes any queued Refresh click
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        
         # Clear existing list
         for widget in self.list_frame.winfo_children():
             widget.destroy()
-        self.browse_thumbnails = []
+        self._render_gen_id += 1  # Drop rows still being loaded by an earlier refresh
+        for future in self._thumb_futures:
+            future.cancel()
+        self._thumb_futures.clear()
+        self._pending_thumbs.clear()
         
         output_dir = Path(self.config.get("output_dir", "output"))
         
-        if not output_dir.exists():
+        # Find all clip folders
+        try:
+            with os.scandir(output_dir) as it:
+                entries = [e for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith("_")]
+        except OSError:
+            self.browse_thumbnails.clear()
             ctk.CTkLabel(self.list_frame, text="📂 Output folder not found", 
                 font=ctk.CTkFont(size=13), text_color="gray").pack(pady=30)
             return
+        entries.sort(key=lambda e: e.name, reverse=True)
+        clip_folders = [Path(e.path) for e in entries[:50]]  # Limit to 50
         
-        # Find all clip folders
-        clip_folders = sorted([d for d in output_dir.iterdir() if d.is_dir() and not d.name.startswith("_")], reverse=True)
+        # Drop cached thumbnails for clips no longer listed
+        current_paths = {folder / "master.mp4" for folder in clip_folders}
+        self.browse_thumbnails = {path: img for path, img in self.browse_thumbnails.items() if path in current_paths}
         
         if not clip_folders:
             ctk.CTkLabel(self.list_frame, text="📹 No videos found\n\nProcess a video to see it here", 
                 font=ctk.CTkFont(size=13), text_color="gray", justify="center").pack(pady=30)
             return
         
-        # Create list items with thumbnails
-        for folder in clip_folders[:50]:  # Limit to 50
-            data_file = folder / "data.json"
-            master_file = folder / "master.mp4"
+        # Parse data.json files off the UI thread, then build rows
+        gen_id = self._render_gen_id
+        
+        def load():
+            results = list(self._thumb_pool.map(self._load_clip_meta, clip_folders))
+            self.after(0, self._populate_browse_rows, results, gen_id)
+        
+        threading.Thread(target=load, daemon=True).start()
+    
+    def _load_clip_meta(self, folder: Path):
+        """Read a clip folder's data.json, returning (folder, data, thumb_fresh) or None"""
+        # One directory listing gives existence and mtimes for every file we need
+        try:
+            with os.scandir(folder) as it:
+                entries = {e.name: e for e in it}
+            data_entry = entries.get("data.json")
+            master_entry = entries.get("master.mp4")
+            if data_entry is None or master_entry is None:
+                return None
+            mtime = data_entry.stat().st_mtime_ns
+            thumb_entry = entries.get(CLIP_THUMB_NAME)
+            thumb_fresh = thumb_entry is not None and thumb_entry.stat().st_mtime_ns >= master_entry.stat().st_mtime_ns
+        except OSError:
+            return None
+        
+        # Reuse the parsed data until data.json changes
+        with self._data_cache_lock:
+            cached = self._data_cache.get(data_entry.path)
+            if cached is not None and cached[0] == mtime:
+                self._data_cache.move_to_end(data_entry.path)
+                return folder, cached[1], thumb_fresh
+        
+        try:
+            with open(data_entry.path, "rb") as f:
+                data = _loads(f.read())
+        except (OSError, ValueError) as e:
+            # Unreadable or malformed data.json - skip this folder
+            debug_log(f"Skipping {folder.name}: {e}")
+            return None
+        
+        with self._data_cache_lock:
+            self._data_cache[data_entry.path] = (mtime, data)
+            self._data_cache.move_to_end(data_entry.path)
+            while len(self._data_cache) > DATA_CACHE_SIZE:
+                self._data_cache.popitem(last=False)
+        return folder, data, thumb_fresh
+    
+    def _populate_browse_rows(self, results: list, gen_id: int):
+        """Create list items with thumbnails for parsed clip folders"""
+        if gen_id != self._render_gen_id:
+            return  # A newer refresh has started
+        self._render_batch([entry for entry in results if entry is not None], 0, gen_id)
+    
+    def _render_batch(self, entries: list, start: int, gen_id: int):
+        """Build a few rows, then yield to the event loop before the next batch"""
+        if gen_id != self._render_gen_id:
+            return  # A newer refresh has started
+        
+        end = start + RENDER_BATCH_SIZE
+        for folder, data, thumb_fresh in entries[start:end]:
+            self._create_browse_row(folder, data, thumb_fresh)
+        if end < len(entries):
+            self.after_idle(self._render_batch, entries, end, gen_id)
+        
+        if self._pending_thumbs and self._visible_check_id is None:
+            self._visible_check_id = self.after_idle(self._load_visible_thumbs)
+    
+    def _create_browse_row(self, folder: Path, data: dict, thumb_fresh: bool = False):
+        """Create a list item with thumbnail, info and action buttons"""
+        master_file = folder / "master.mp4"
+        
+        try:
+            title = data.get("title", "Untitled")[:50]
+            yt_url = data.get("youtube_url")
+            duration = data.get("duration_seconds", 0)
+            hook = data.get("hook_text", "")[:40]
+            subtitle = f"⏱️ {duration:.0f}s • {hook}..."
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # Malformed data.json fields - skip this folder
+            debug_log(f"Skipping {folder.name}: {e}")
+            return
+        
+        # Create list item
+        item = ctk.CTkFrame(self.list_frame, fg_color=("gray85", "gray20"), corner_radius=10)
+        item.pack(fill="x", pady=5, padx=5)
+        
+        # Main content frame (horizontal layout)
+        content_frame = ctk.CTkFrame(item, fg_color="transparent")
+        content_frame.pack(fill="x", padx=12, pady=12)
+        
+        # Thumbnail on left
+        thumb_frame = ctk.CTkFrame(content_frame, width=140, height=80, fg_color=("gray75", "gray30"), corner_radius=8)
+        thumb_frame.pack(side="left")
+        thumb_frame.pack_propagate(False)
+        
+        # Load thumbnail once the row is near the visible area
+        self._pending_thumbs.append((master_file, thumb_frame, item, thumb_fresh))
+        
+        # Info in middle
+        info = ctk.CTkFrame(content_frame, fg_color="transparent")
+        info.pack(side="left", fill="both", expand=True, padx=(12, 12))
+        
+        # Title with YouTube badge if uploaded
+        title_frame = ctk.CTkFrame(info, fg_color="transparent")
+        title_frame.pack(fill="x")
+        
+        title_label = ctk.CTkLabel(title_frame, text=title, font=shared_font(13, "bold"), 
+            anchor="w")
+        title_label.pack(side="left", fill="x", expand=True)
+        
+        # YouTube badge if uploaded
+        if yt_url:
+            yt_badge = ctk.CTkLabel(title_frame, text="▶️", font=shared_font(12), 
+                text_color="#c4302b", cursor="hand2")
+            yt_badge.pack(side="right", padx=(5, 0))
             
-            if data_file.exists() and master_file.exists():
-                try:
-                    with open(data_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    
-                    # Create list item
-                    item = ctk.CTkFrame(self.list_frame, fg_color=("gray85", "gray20"), corner_radius=10)
-                    item.pack(fill="x", pady=5, padx=5)
-                    
-                    # Main content frame (horizontal layout)
-                    content_frame = ctk.CTkFrame(item, fg_color="transparent")
-                    content_frame.pack(fill="x", padx=12, pady=12)
-                    
-                    # Thumbnail on left
-                    thumb_frame = ctk.CTkFrame(content_frame, width=140, height=80, fg_color=("gray75", "gray30"), corner_radius=8)
-                    thumb_frame.pack(side="left")
-                    thumb_frame.pack_propagate(False)
-                    
-                    # Load thumbnail async
-                    self.load_thumbnail(master_file, thumb_frame)
-                    
-                    # Info in middle
-                    info = ctk.CTkFrame(content_frame, fg_color="transparent")
-                    info.pack(side="left", fill="both", expand=True, padx=(12, 12))
-                    
-                    # Title with YouTube badge if uploaded
-                    title_frame = ctk.CTkFrame(info, fg_color="transparent")
-                    title_frame.pack(fill="x")
-                    
-                    title = data.get("title", "Untitled")[:50]
-                    title_label = ctk.CTkLabel(title_frame, text=title, font=ctk.CTkFont(size=13, weight="bold"), 
-                        anchor="w")
-                    title_label.pack(side="left", fill="x", expand=True)
-                    
-                    # YouTube badge if uploaded
-                    if data.get("youtube_url"):
-                        yt_badge = ctk.CTkLabel(title_frame, text="▶️", font=ctk.CTkFont(size=12), 
-                            text_color="#c4302b", cursor="hand2")
-                        yt_badge.pack(side="right", padx=(5, 0))
-                        
-                        # Make badge clickable to open YouTube
-                        yt_url = data.get("youtube_url")
-                        yt_badge.bind("<Button-1>", lambda e, url=yt_url: self.open_youtube_url(url))
-                    
-                    duration = data.get("duration_seconds", 0)
-                    hook = data.get("hook_text", "")[:40]
-                    subtitle_label = ctk.CTkLabel(info, text=f"⏱️ {duration:.0f}s • {hook}...", 
-                        font=ctk.CTkFont(size=11), text_color="gray", anchor="w")
-                    subtitle_label.pack(fill="x", pady=(3, 0))
-                    
-                    date_label = ctk.CTkLabel(info, text=f"📅 {folder.name}", 
-                        font=ctk.CTkFont(size=10), text_color="gray", anchor="w")
-                    date_label.pack(fill="x", pady=(2, 0))
-                    
-                    # Action buttons below date (horizontal layout)
-                    btn_row = ctk.CTkFrame(info, fg_color="transparent")
-                    btn_row.pack(fill="x", pady=(8, 0))
-                    
-                    # Play button
-                    play_btn = ctk.CTkButton(btn_row, text="▶ Play Video", height=32,
-                        font=ctk.CTkFont(size=11), fg_color=("#3B8ED0", "#1F6AA5"),
-                        command=lambda v=master_file: self.play_video(v))
-                    play_btn.pack(side="left", padx=(0, 5))
-                    
-                    # YouTube upload button (or uploaded indicator)
-                    if data.get("youtube_url"):
-                        yt_btn = ctk.CTkButton(btn_row, text="✓ Uploaded to YouTube", height=32,
-                            font=ctk.CTkFont(size=11), fg_color="#27ae60", text_color="white",
-                            state="disabled", hover_color="#27ae60")
-                        yt_btn.pack(side="left", padx=(0, 5))
-                    else:
-                        yt_btn = ctk.CTkButton(btn_row, text="⬆ Upload to YouTube", height=32,
-                            font=ctk.CTkFont(size=11), fg_color="#c4302b", hover_color="#ff0000",
-                            command=lambda f=folder, v=master_file, d=data: self.upload_video_from_card(f, v, d))
-                        yt_btn.pack(side="left", padx=(0, 5))
-                    
-                    # Repliz upload button
-                    repliz_btn = ctk.CTkButton(btn_row, text="📤 Upload via Repliz", height=32,
-                        font=ctk.CTkFont(size=11), fg_color=("#2196F3", "#1976D2"), 
-                        hover_color=("#1976D2", "#1565C0"),
-                        command=lambda f=folder, v=master_file, d=data: self.upload_via_repliz(f, v, d))
-                    repliz_btn.pack(side="left", padx=(0, 0))
-                    
-                except:
-                    pass
+            # Make badge clickable to open YouTube
+            yt_badge.bind("<Button-1>", partial(self.open_youtube_url, yt_url))
+        
+        subtitle_label = ctk.CTkLabel(info, text=subtitle, 
+            font=shared_font(11), text_color="gray", anchor="w")
+        subtitle_label.pack(fill="x", pady=(3, 0))
+        
+        date_label = ctk.CTkLabel(info, text=f"📅 {folder.name}", 
+            font=shared_font(10), text_color="gray", anchor="w")
+        date_label.pack(fill="x", pady=(2, 0))
+        
+        # Action buttons below date (horizontal layout)
+        btn_row = ctk.CTkFrame(info, fg_color="transparent")
+        btn_row.pack(fill="x", pady=(8, 0))
+        
+        # Play button
+        play_btn = ctk.CTkButton(btn_row, text="▶ Play Video", height=32,
+            font=shared_font(11), fg_color=("#3B8ED0", "#1F6AA5"),
+            command=partial(self.play_video, master_file))
+        play_btn.pack(side="left", padx=(0, 5))
+        
+        # YouTube upload button (or uploaded indicator)
+        if yt_url:
+            yt_btn = ctk.CTkButton(btn_row, text="✓ Uploaded to YouTube", height=32,
+                font=shared_font(11), fg_color="#27ae60", text_color="white",
+                state="disabled", hover_color="#27ae60")
+            yt_btn.pack(side="left", padx=(0, 5))
+        else:
+            yt_btn = ctk.CTkButton(btn_row, text="⬆ Upload to YouTube", height=32,
+                font=shared_font(11), fg_color="#c4302b", hover_color="#ff0000",
+                command=partial(self.upload_video_from_card, folder, master_file, data))
+            yt_btn.pack(side="left", padx=(0, 5))
+        
+        # Repliz upload button
+        repliz_btn = ctk.CTkButton(btn_row, text="📤 Upload via Repliz", height=32,
+            font=shared_font(11), fg_color=("#2196F3", "#1976D2"), 
+            hover_color=("#1976D2", "#1565C0"),
+            command=partial(self.upload_via_repliz, folder, master_file, data))
+        repliz_btn.pack(side="left", padx=(0, 0))
+    
+    def _on_list_scroll(self, first, last):
+        """Forward scroll position to the scrollbar and check for newly visible rows"""
+        self._list_scrollbar.set(first, last)
+        if self._pending_thumbs and self._visible_check_id is None:
+            self._visible_check_id = self.after_idle(self._load_visible_thumbs)
+    
+    def _load_visible_thumbs(self):
+        """Start thumbnail loads for rows within one screen of the visible area"""
+        self._visible_check_id = None
+        if self._list_canvas is None:
+            # No scroll hook available - load everything that is still pending
+            pending, self._pending_thumbs = self._pending_thumbs, []
+            for video_path, frame, row, thumb_fresh in pending:
+                if row.winfo_exists():
+                    self.load_thumbnail(video_path, frame, thumb_fresh)
+            return
+        
+        top, bottom = self._list_canvas.yview()
+        height = self.list_frame.winfo_height()
+        view_top, view_bottom = top * height, bottom * height
+        margin = view_bottom - view_top  # Look ahead one screen in each direction
+        
+        remaining = []
+        for pending in self._pending_thumbs:
+            video_path, frame, row, thumb_fresh = pending
+            if not row.winfo_exists():
+                continue
+            y = row.winfo_y()
+            if y + row.winfo_height() >= view_top - margin and y <= view_bottom + margin:
+                self.load_thumbnail(video_path, frame, thumb_fresh)
+            else:
+                remaining.append(pending)
+        self._pending_thumbs = remaining
     
-    def load_thumbnail(self, video_path: Path, frame: ctk.CTkFrame):
+    def load_thumbnail(self, video_path: Path, frame: ctk.CTkFrame, thumb_fresh: bool = None):
         """Load thumbnail from video file"""
+        cached = self.browse_thumbnails.get(video_path)
+        if cached is not None:
+            self._place_thumb(frame, cached)
+            return
+        
         def extract():
             try:
-                cap = cv2.VideoCapture(str(video_path))
-                cap.set(cv2.CAP_PROP_POS_FRAMES, 30)  # Get frame at ~1 second
-                ret, img = cap.read()
-                cap.release()
-                
-                if ret:
-                    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                    pil_img = Image.fromarray(img)
-                    pil_img.thumbnail((140, 80), Image.Resampling.LANCZOS)
-                    self.after(0, lambda: self.show_thumb(frame, pil_img))
-            except:
-                pass
-        
-        threading.Thread(target=extract, daemon=True).start()
+                pil_img = load_clip_thumbnail(video_path, fresh=thumb_fresh)
+                if pil_img is not None:
+                    self.after(0, lambda: self.show_thumb(frame, pil_img, video_path))
+            except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+                # Leave the placeholder if ffmpeg is missing or the frame can't be decoded
+                debug_log(f"Thumbnail failed for {video_path.parent.name}: {e}")
+        
+        self._thumb_futures.append(self._thumb_pool.submit(extract))
     
-    def show_thumb(self, frame: ctk.CTkFrame, img: Image.Image):
+    def show_thumb(self, frame: ctk.CTkFrame, img: Image.Image, video_path: Path):
         """Display thumbnail in frame"""
         ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
-        self.browse_thumbnails.append(ctk_img)  # Keep reference
-        
+        self.browse_thumbnails[video_path] = ctk_img  # Keep reference
+        self._place_thumb(frame, ctk_img)
+    
+    def _place_thumb(self, frame: ctk.CTkFrame, ctk_img: ctk.CTkImage):
+        """Put an already-built thumbnail image into its frame"""
         for widget in frame.winfo_children():
             widget.destroy()
         ctk.CTkLabel(frame, image=ctk_img, text="").pack(expand=True)
@@ -248,9 +382,9 @@ class BrowsePage(ctk.CTkFrame):
         if sys.platform == "win32":
             os.startfile(str(video_path))
         elif sys.platform == "darwin":
-            subprocess.run(["open", str(video_path)])
+            spawn_detached(["open", str(video_path)])
         else:
-            subprocess.run(["xdg-open", str(video_path)])
+            spawn_detached(["xdg-open", str(video_path)])
     
     def upload_video_from_card(self, folder: Path, video_path: Path, data: dict):
         """Upload video to YouTube from card button"""
@@ -306,10 +440,9 @@ class BrowsePage(ctk.CTkFrame):
             yt_client, model, self.config.get("temperature", 1.0))
     
     
-    def open_youtube_url(self, url: str):
+    def open_youtube_url(self, url: str, event=None):
         """Open YouTube URL in browser"""
-        import webbrowser
-        webbrowser.open(url)
+        webbrowser.open(url, new=2)
     
     def open_output_folder(self):
         """Open the output folder"""
@@ -318,20 +451,18 @@ class BrowsePage(ctk.CTkFrame):
             if sys.platform == "win32":
                 os.startfile(str(output_dir))
             elif sys.platform == "darwin":
-                subprocess.run(["open", str(output_dir)])
+                spawn_detached(["open", str(output_dir)])
             else:
-                subprocess.run(["xdg-open", str(output_dir)])
+                spawn_detached(["xdg-open", str(output_dir)])
         else:
             messagebox.showerror("Error", "Output folder not found")
     
     def open_github(self):
         """Open GitHub repository"""
-        import webbrowser
         webbrowser.open("https://github.com/jipraks/yt-short-clipper")
     
     def open_discord(self):
         """Open Discord server"""
-        import webbrowser
         webbrowser.open("https://s.id/ytsdiscord")
     
     def show_page(self, page_name: str):
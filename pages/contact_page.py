@@ -2,13 +2,30 @@
 Contact form page for user feedback and support
 """
 
+import re
 import threading
 import json
-import urllib.request
-import urllib.parse
+import requests
+from requests.adapters import HTTPAdapter, Retry
 import customtkinter as ctk
 from tkinter import messagebox
 
+from components.page_layout import shared_font
+
+# Serialize request bodies straight to UTF-8 bytes with orjson when it is installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Shared keep-alive pool; only connection failures are retried, so a POST is never sent twice
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_maxsize=2, max_retries=Retry(total=2, backoff_factor=0.3)))
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class ContactPage(ctk.CTkFrame):
     """Contact form page"""
@@ -29,7 +46,7 @@ class ContactPage(ctk.CTkFrame):
         
         ctk.CTkButton(header, text="←", width=40, fg_color="transparent", 
             hover_color=("gray75", "gray25"), command=self.on_back).pack(side="left")
-        ctk.CTkLabel(header, text="Contact Developer", font=ctk.CTkFont(size=22, weight="bold")).pack(side="left", padx=10)
+        ctk.CTkLabel(header, text="Contact Developer", font=shared_font(22, "bold")).pack(side="left", padx=10)
         
         # Scrollable main content
         main = ctk.CTkScrollableFrame(self)
@@ -85,9 +102,7 @@ class ContactPage(ctk.CTkFrame):
     
     def validate_email(self, email: str) -> bool:
         """Simple email validation"""
-        import re
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def submit_form(self):
         """Submit contact form"""
@@ -140,20 +155,19 @@ class ContactPage(ctk.CTkFrame):
                 
                 # Send POST request
                 url = "https://api.ytclip.org/webhook/yt-clipper/contact-form"
-                json_data = json.dumps(data).encode('utf-8')
+                json_data = _dumps(data)
                 
-                req = urllib.request.Request(url, data=json_data, 
+                response = _HTTP.post(url, data=json_data,
                     headers={
                         'Content-Type': 'application/json',
                         'User-Agent': 'YT-Short-Clipper'
                     },
-                    method='POST')
+                    timeout=10.0)
                 
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status == 200:
-                        self.after(0, self.on_submit_success)
-                    else:
-                        self.after(0, lambda: self.on_submit_error(f"Server error: {response.status}"))
+                if response.status_code == 200:
+                    self.after(0, self.on_submit_success)
+                else:
+                    self.after(0, lambda: self.on_submit_error(f"Server error: {response.status_code}"))
             
             except Exception as e:
                 self.after(0, lambda: self.on_submit_error(str(e)))
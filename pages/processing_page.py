@@ -16,6 +16,7 @@ class ProcessingPage(ctk.CTkFrame):
         self.on_back = on_back_callback
         self.on_open_output = on_open_output_callback
         self.on_browse = on_browse_callback
+        self._shown_tokens = (None, None, None)  # Last values written to the token labels
         
         self.create_ui()
     
@@ -129,6 +130,7 @@ class ProcessingPage(ctk.CTkFrame):
         self.gpt_label.configure(text="0")
         self.whisper_label.configure(text="0")
         self.tts_label.configure(text="0")
+        self._shown_tokens = (None, None, None)
         self.cancel_btn.configure(state="normal")
         self.open_btn.configure(state="disabled")
         self.back_btn.configure(state="disabled")
@@ -139,10 +141,16 @@ class ProcessingPage(ctk.CTkFrame):
         self.status_label.configure(text=msg)
     
     def update_tokens(self, gpt_total: int, whisper_minutes: float, tts_chars: int):
-        """Update token usage display"""
-        self.gpt_label.configure(text=f"{gpt_total:,}")
-        self.whisper_label.configure(text=f"{whisper_minutes:.1f}m")
-        self.tts_label.configure(text=f"{tts_chars:,}")
+        """Update token usage display, touching only labels whose value changed"""
+        whisper_minutes = round(whisper_minutes, 1)
+        shown_gpt, shown_whisper, shown_tts = self._shown_tokens
+        if gpt_total != shown_gpt:
+            self.gpt_label.configure(text=f"{gpt_total:,}")
+        if whisper_minutes != shown_whisper:
+            self.whisper_label.configure(text=f"{whisper_minutes:.1f}m")
+        if tts_chars != shown_tts:
+            self.tts_label.configure(text=f"{tts_chars:,}")
+        self._shown_tokens = (gpt_total, whisper_minutes, tts_chars)
     
     def on_complete(self):
         """Called when processing completes successfully"""
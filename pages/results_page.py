@@ -7,13 +7,16 @@ import sys
 import json
 import threading
 import subprocess
+from collections import deque
+from functools import partial
 import customtkinter as ctk
 from pathlib import Path
 from tkinter import messagebox
 from PIL import Image
-import cv2
 
+from components.page_layout import shared_font
 from dialogs.youtube_upload import YouTubeUploadDialog
+from utils.helpers import load_clip_thumbnail, spawn_detached
 
 
 class ResultsPage(ctk.CTkFrame):
@@ -29,7 +32,9 @@ class ResultsPage(ctk.CTkFrame):
         self.open_output = open_output_callback
         
         self.created_clips = []
-        self._thumb_refs = []
+        self._thumb_refs = deque(maxlen=128)
+        self._video_thumb_cache = {}  # master.mp4 path -> CTkImage
+        self._clip_meta_cache = {}  # folder path -> (data.json mtime_ns, clip dict)
         
         self.create_ui()
     
@@ -38,7 +43,7 @@ class ResultsPage(ctk.CTkFrame):
         # Header
         header = ctk.CTkFrame(self, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=(15, 10))
-        ctk.CTkLabel(header, text="📋 Results", font=ctk.CTkFont(size=22, weight="bold")).pack(side="left")
+        ctk.CTkLabel(header, text="📋 Results", font=shared_font(22, "bold")).pack(side="left")
         
         # Clips list (scrollable)
         self.clips_frame = ctk.CTkScrollableFrame(self, height=450)
@@ -58,25 +63,47 @@ class ResultsPage(ctk.CTkFrame):
         self.created_clips = []
         
         # Find all clip folders (sorted by name = creation time)
-        clip_folders = sorted([d for d in output_dir.iterdir() if d.is_dir() and not d.name.startswith("_")], reverse=True)
-        
-        for folder in clip_folders[:20]:  # Limit to 20 most recent
-            data_file = folder / "data.json"
-            master_file = folder / "master.mp4"
+        try:
+            with os.scandir(output_dir) as it:
+                entries = [e for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith("_")]
+        except OSError:
+            return
+        entries.sort(key=lambda e: e.name, reverse=True)
+        
+        for entry in entries[:20]:  # Limit to 20 most recent
+            data_file = os.path.join(entry.path, "data.json")
+            master_file = os.path.join(entry.path, "master.mp4")
+            
+            try:
+                mtime = os.stat(data_file).st_mtime_ns
+            except OSError:
+                continue
+            if not os.path.exists(master_file):
+                continue
             
-            if data_file.exists() and master_file.exists():
-                try:
-                    with open(data_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                    self.created_clips.append({
-                        "folder": folder,
-                        "video": master_file,
-                        "title": data.get("title", "Untitled"),
-                        "hook_text": data.get("hook_text", ""),
-                        "duration": data.get("duration_seconds", 0)
-                    })
-                except:
-                    pass
+            # Reuse parsed data.json until the file changes
+            cached = self._clip_meta_cache.get(entry.path)
+            if cached is not None and cached[0] == mtime:
+                self.created_clips.append(cached[1])
+                continue
+            
+            try:
+                with open(data_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    continue  # Valid JSON but not clip metadata
+                folder = Path(entry.path)
+                clip = {
+                    "folder": folder,
+                    "video": folder / "master.mp4",
+                    "title": data.get("title", "Untitled"),
+                    "hook_text": data.get("hook_text", ""),
+                    "duration": data.get("duration_seconds", 0)
+                }
+            except (OSError, ValueError):
+                continue
+            self._clip_meta_cache[entry.path] = (mtime, clip)
+            self.created_clips.append(clip)
     
     def show_results(self):
         """Show results page with clip list"""
@@ -85,7 +112,7 @@ class ResultsPage(ctk.CTkFrame):
             widget.destroy()
         
         # Clear thumbnail references
-        self._thumb_refs = []
+        self._thumb_refs.clear()
         
         if not self.created_clips:
             ctk.CTkLabel(self.clips_frame, text="No clips found", text_color="gray").pack(pady=50)
@@ -121,14 +148,14 @@ class ResultsPage(ctk.CTkFrame):
         btn_frame.pack(side="right", padx=10, pady=10)
         
         ctk.CTkButton(btn_frame, text="▶", width=35, height=30, 
-            command=lambda v=clip["video"]: self.play_video(v)).pack(side="left", padx=2)
+            command=partial(self.play_video, clip["video"])).pack(side="left", padx=2)
         ctk.CTkButton(btn_frame, text="📂", width=35, height=30, fg_color="gray",
-            command=lambda f=clip["folder"]: self.open_folder(f)).pack(side="left", padx=2)
+            command=partial(self.open_folder, clip["folder"])).pack(side="left", padx=2)
         
         # YouTube upload button
         upload_btn = ctk.CTkButton(btn_frame, text="⬆️ YT", width=50, height=30, 
             fg_color="#c4302b", hover_color="#ff0000",
-            command=lambda c=clip: self.upload_to_youtube(c))
+            command=partial(self.upload_to_youtube, clip))
         upload_btn.pack(side="left", padx=2)
     
     def upload_to_youtube(self, clip: dict):
@@ -162,26 +189,31 @@ class ResultsPage(ctk.CTkFrame):
     
     def load_video_thumbnail(self, video_path: Path, frame: ctk.CTkFrame):
         """Load thumbnail from video file"""
+        cached = self._video_thumb_cache.get(video_path)
+        if cached is not None:
+            self._place_video_thumb(frame, cached)
+            return
+        
         def extract():
             try:
-                cap = cv2.VideoCapture(str(video_path))
-                cap.set(cv2.CAP_PROP_POS_FRAMES, 30)  # Get frame at ~1 second
-                ret, img = cap.read()
-                cap.release()
-                
-                if ret:
-                    img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-                    pil_img = Image.fromarray(img)
-                    pil_img.thumbnail((120, 80), Image.Resampling.LANCZOS)
-                    self.after(0, lambda: self.show_video_thumb(frame, pil_img))
-            except:
+                # Shares the cached thumbnail with the browse page, shrunk to this card's size
+                pil_img = load_clip_thumbnail(video_path, (120, 80))
+                if pil_img is not None:
+                    self.after(0, lambda: self.show_video_thumb(frame, pil_img, video_path))
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                # Leave the placeholder if ffmpeg is missing or the frame can't be decoded
                 pass
         
         threading.Thread(target=extract, daemon=True).start()
     
-    def show_video_thumb(self, frame: ctk.CTkFrame, img: Image.Image):
+    def show_video_thumb(self, frame: ctk.CTkFrame, img: Image.Image, video_path: Path):
         """Display thumbnail in frame"""
         ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
+        self._video_thumb_cache[video_path] = ctk_img
+        self._place_video_thumb(frame, ctk_img)
+    
+    def _place_video_thumb(self, frame: ctk.CTkFrame, ctk_img: ctk.CTkImage):
+        """Put an already-built thumbnail image into its frame"""
         self._thumb_refs.append(ctk_img)  # Store reference to prevent garbage collection
         
         for widget in frame.winfo_children():
@@ -193,15 +225,15 @@ class ResultsPage(ctk.CTkFrame):
         if sys.platform == "win32":
             os.startfile(str(video_path))
         elif sys.platform == "darwin":
-            subprocess.run(["open", str(video_path)])
+            spawn_detached(["open", str(video_path)])
         else:
-            subprocess.run(["xdg-open", str(video_path)])
+            spawn_detached(["xdg-open", str(video_path)])
     
     def open_folder(self, folder_path: Path):
         """Open folder in file explorer"""
         if sys.platform == "win32":
             os.startfile(str(folder_path))
         elif sys.platform == "darwin":
-            subprocess.run(["open", str(folder_path)])
+            spawn_detached(["open", str(folder_path)])
         else:
-            subprocess.run(["xdg-open", str(folder_path)])
+            spawn_detached(["xdg-open", str(folder_path)])
@@ -7,6 +7,7 @@ import customtkinter as ctk
 
 from pages.settings.base_dialog import BaseSettingsSubPage
 from version import __version__
+from components.page_layout import shared_font
 
 
 class AboutSettingsSubPage(BaseSettingsSubPage):
@@ -27,9 +28,9 @@ class AboutSettingsSubPage(BaseSettingsSubPage):
         info_frame.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(info_frame, text="YT Short Clipper", 
-            font=ctk.CTkFont(size=20, weight="bold")).pack()
+            font=shared_font(20, "bold")).pack()
         ctk.CTkLabel(info_frame, text=f"v{__version__}", 
-            font=ctk.CTkFont(size=12), text_color="gray").pack(pady=(5, 0))
+            font=shared_font(12), text_color="gray").pack(pady=(5, 0))
         
         # Check for updates button
         if self.check_update:
@@ -48,16 +49,16 @@ short-form content for TikTok, Instagram Reels,
 and YouTube Shorts."""
         
         ctk.CTkLabel(desc_frame, text=desc_text, justify="center", 
-            font=ctk.CTkFont(size=11), wraplength=380).pack(padx=15, pady=15)
+            font=shared_font(11), wraplength=380).pack(padx=15, pady=15)
         
         # Credits
         credits_frame = ctk.CTkFrame(self.content, fg_color="transparent")
         credits_frame.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(credits_frame, text="Made with coffee by", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack()
+            font=shared_font(11), text_color="gray").pack()
         ctk.CTkLabel(credits_frame, text="Aji Prakoso", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(pady=(5, 0))
+            font=shared_font(13, "bold")).pack(pady=(5, 0))
         
         # Links
         links_frame = ctk.CTkFrame(self.content, fg_color="transparent")
@@ -80,4 +81,4 @@ and YouTube Shorts."""
         footer_frame.pack(side="bottom", fill="x", pady=(10, 0))
         
         ctk.CTkLabel(footer_frame, text="Open Source - MIT License", 
-            font=ctk.CTkFont(size=10), text_color="gray").pack()
+            font=shared_font(10), text_color="gray").pack()
@@ -5,6 +5,7 @@ AI API Settings Sub-Page - Card-based navigation to individual providers
 import customtkinter as ctk
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
 
 
 class AIAPISettingsSubPage(BaseSettingsSubPage):
@@ -52,17 +53,17 @@ class AIAPISettingsSubPage(BaseSettingsSubPage):
         header.bind("<Button-1>", lambda e, k=key: self.navigate_to_provider(k))
         
         ctk.CTkLabel(header, text=title, 
-            font=ctk.CTkFont(size=12, weight="bold")).pack(side="left")
+            font=shared_font(12, "bold")).pack(side="left")
         
-        status = ctk.CTkLabel(header, text="", font=ctk.CTkFont(size=10))
+        status = ctk.CTkLabel(header, text="", font=shared_font(10))
         status.pack(side="right")
         setattr(self, f"{key}_status", status)
         
-        d = ctk.CTkLabel(card, text=desc, font=ctk.CTkFont(size=9), text_color="gray")
+        d = ctk.CTkLabel(card, text=desc, font=shared_font(9), text_color="gray")
         d.pack(anchor="w", padx=12, pady=(0, 5))
         d.bind("<Button-1>", lambda e, k=key: self.navigate_to_provider(k))
         
-        m = ctk.CTkLabel(card, text="", font=ctk.CTkFont(size=9), text_color="gray")
+        m = ctk.CTkLabel(card, text="", font=shared_font(9), text_color="gray")
         m.pack(anchor="w", padx=12, pady=(0, 12))
         m.bind("<Button-1>", lambda e, k=key: self.navigate_to_provider(k))
         setattr(self, f"{key}_model", m)
@@ -2,11 +2,57 @@
 Base class for AI Provider settings pages
 """
 
+import time
+import atexit
+import hashlib
 import threading
 import customtkinter as ctk
 from tkinter import messagebox
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
+
+MODELS_CACHE_TTL = 24 * 60 * 60  # Seconds a fetched model list is reused
+API_TIMEOUT = 10.0  # Seconds allowed for a settings API check
+API_CONNECT_TIMEOUT = 5.0  # Seconds allowed to establish the connection
+
+# (base_url, api key fingerprint) -> (fetched_at, sorted model ids), shared by all provider pages
+_models_cache = {}
+
+# (api_key, base_url) -> OpenAI client, so repeat Load/Validate clicks reuse the open connection
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _models_cache_key(base_url, api_key):
+    """Cache key for a provider's model list, without keeping the raw API key"""
+    return base_url, hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _open_client(api_key, base_url):
+    """OpenAI client for settings checks, with bounded timeouts (one per key/URL)"""
+    with _clients_lock:
+        client = _clients.get((api_key, base_url))
+        if client is None:
+            from openai import OpenAI, Timeout
+            client = _clients[(api_key, base_url)] = OpenAI(api_key=api_key, base_url=base_url,
+                max_retries=1, timeout=Timeout(API_TIMEOUT, connect=API_CONNECT_TIMEOUT))
+        return client
+
+
+@atexit.register
+def _close_clients():
+    """Close pooled connections of the cached settings clients"""
+    for client in _clients.values():
+        client.close()
+
+
+def _get_cached_models(base_url, api_key):
+    """Return the cached model list for this URL/key, or None if missing or stale"""
+    entry = _models_cache.get(_models_cache_key(base_url, api_key))
+    if entry and time.time() - entry[0] < MODELS_CACHE_TTL:
+        return entry[1]
+    return None
 
 
 class BaseProviderSettingsPage(BaseSettingsSubPage):
@@ -38,7 +84,7 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
         type_frame = ctk.CTkFrame(type_section, fg_color="transparent")
         type_frame.pack(fill="x", padx=15, pady=(0, 12))
         
-        ctk.CTkLabel(type_frame, text="Select API Provider", font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(type_frame, text="Select API Provider", font=shared_font(11)).pack(anchor="w")
         
         self.provider_type_var = ctk.StringVar(value="ytclip")
         self.provider_dropdown = ctk.CTkOptionMenu(type_frame, 
@@ -57,7 +103,7 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
         url_frame = ctk.CTkFrame(self.url_section, fg_color="transparent")
         url_frame.pack(fill="x", padx=15, pady=(0, 12))
         
-        ctk.CTkLabel(url_frame, text="API Base URL", font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(url_frame, text="API Base URL", font=shared_font(11)).pack(anchor="w")
         self.url_entry = ctk.CTkEntry(url_frame, placeholder_text="https://api.openai.com/v1", height=36)
         self.url_entry.pack(fill="x", pady=(5, 0))
         
@@ -67,7 +113,7 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
         key_frame = ctk.CTkFrame(key_section, fg_color="transparent")
         key_frame.pack(fill="x", padx=15, pady=(0, 12))
         
-        ctk.CTkLabel(key_frame, text="API Key", font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(key_frame, text="API Key", font=shared_font(11)).pack(anchor="w")
         self.key_entry = ctk.CTkEntry(key_frame, placeholder_text="sk-...", show="•", height=36)
         self.key_entry.pack(fill="x", pady=(5, 0))
         
@@ -77,7 +123,7 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
         model_frame = ctk.CTkFrame(self.model_section, fg_color="transparent")
         model_frame.pack(fill="x", padx=15, pady=(0, 12))
         
-        ctk.CTkLabel(model_frame, text="Model Name", font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(model_frame, text="Model Name", font=shared_font(11)).pack(anchor="w")
         
         model_row = ctk.CTkFrame(model_frame, fg_color="transparent")
         model_row.pack(fill="x", pady=(5, 0))
@@ -165,19 +211,26 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
             return
         
         url = self.get_base_url()
+        cached = _get_cached_models(url, api_key)
+        if cached is not None:
+            self._on_models_loaded(cached)
+            return
+        
         self.load_btn.configure(state="disabled", text="Loading...")
         
         def do_load():
+            from openai import APIConnectionError
             try:
-                from openai import OpenAI
-                client = OpenAI(api_key=api_key, base_url=url)
-                models_response = client.models.list()
-                models = [m.id for m in models_response.data]
-                models.sort()
+                client = _open_client(api_key, url)
+                models = sorted(m.id for m in client.models.list())
+                _models_cache[_models_cache_key(url, api_key)] = (time.time(), models)
                 
-                self.after(0, lambda: self._on_models_loaded(models))
+                self._post(lambda: self._on_models_loaded(models))
+            except APIConnectionError as e:
+                # Timeouts and unreachable hosts - not a problem with the key itself
+                self._post(lambda err=f"Network error (check connection or URL): {e}": self._on_models_error(err))
             except Exception as e:
-                self.after(0, lambda: self._on_models_error(str(e)))
+                self._post(lambda err=str(e): self._on_models_error(err))
         
         threading.Thread(target=do_load, daemon=True).start()
     
@@ -216,11 +269,17 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
             messagebox.showerror("Error", "Please select a model")
             return
         
+        from openai import APIConnectionError
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key, base_url=url)
-            client.models.list()
+            client = _open_client(api_key, url)
+            models = sorted(m.id for m in client.models.list())
+            _models_cache[_models_cache_key(url, api_key)] = (time.time(), models)
+            if models and model not in models:
+                messagebox.showwarning("Warning", f"API Key works, but model '{model}' is not offered at:\n{url}")
+                return
             messagebox.showinfo("Success", f"✓ Configuration valid!\n\nModel: {model}\nURL: {url}")
+        except APIConnectionError as e:
+            messagebox.showerror("Error", f"Network error (check connection or URL):\n{str(e)}")
         except Exception as e:
             messagebox.showerror("Error", f"Validation failed:\n{str(e)}")
     
@@ -273,6 +332,11 @@ class BaseProviderSettingsPage(BaseSettingsSubPage):
                 else:
                     # For dynamic models, add to dropdown if not empty
                     self.model_var.set(saved_model)
+                    cached = _get_cached_models(self.get_base_url(), provider.get("api_key", ""))
+                    if cached:
+                        # Models were already fetched for this key - no need to click Load again
+                        self.models_list = cached
+                        self.model_dropdown.configure(values=cached)
                     current_values = list(self.model_dropdown.cget("values"))
                     if saved_model not in current_values:
                         self.model_dropdown.configure(values=[saved_model] + current_values)
@@ -5,6 +5,7 @@ Caption Maker Settings Page
 import customtkinter as ctk
 
 from pages.settings.ai_providers.base_provider import BaseProviderSettingsPage
+from components.page_layout import shared_font
 
 
 class CaptionMakerSettingsPage(BaseProviderSettingsPage):
@@ -31,10 +32,10 @@ class CaptionMakerSettingsPage(BaseProviderSettingsPage):
         info_frame.pack(fill="x", pady=(0, 10))
         
         ctk.CTkLabel(info_frame, text="📝 About Caption Maker", 
-            font=ctk.CTkFont(size=11, weight="bold")).pack(anchor="w", padx=12, pady=(10, 5))
+            font=shared_font(11, "bold")).pack(anchor="w", padx=12, pady=(10, 5))
         ctk.CTkLabel(info_frame, 
             text="Uses Whisper API to transcribe audio and generate\nword-by-word captions with precise timing.", 
-            font=ctk.CTkFont(size=10), text_color="gray", justify="left").pack(anchor="w", padx=12, pady=(0, 10))
+            font=shared_font(10), text_color="gray", justify="left").pack(anchor="w", padx=12, pady=(0, 10))
         
         # Call parent to create standard fields
         super().create_provider_content()
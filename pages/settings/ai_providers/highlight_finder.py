@@ -3,8 +3,10 @@ Highlight Finder Settings Page
 """
 
 import customtkinter as ctk
+from tkinter import messagebox
 
 from pages.settings.ai_providers.base_provider import BaseProviderSettingsPage
+from components.page_layout import shared_font
 
 
 class HighlightFinderSettingsPage(BaseProviderSettingsPage):
@@ -12,6 +14,10 @@ class HighlightFinderSettingsPage(BaseProviderSettingsPage):
     
     # Load models from API (no fixed list)
     FIXED_MODELS = None
+    # Placeholders clipper_core fills into the prompt
+    REQUIRED_PLACEHOLDERS = ("{num_clips}", "{video_context}", "{transcript}")
+    # Default system prompt, fetched from clipper_core on first reset
+    _default_prompt_cache = None
     
     def __init__(self, parent, config, on_save_callback, on_back_callback):
         super().__init__(
@@ -23,10 +29,19 @@ class HighlightFinderSettingsPage(BaseProviderSettingsPage):
             on_back_callback=on_back_callback
         )
     
+    @classmethod
+    def _get_default_prompt(cls):
+        """Get the default highlight prompt, importing clipper_core only once"""
+        if cls._default_prompt_cache is None:
+            from clipper_core import AutoClipperCore
+            cls._default_prompt_cache = AutoClipperCore.get_default_prompt()
+        return cls._default_prompt_cache
+    
     def _reset_system_message(self):
         """Reset system message to default"""
-        from clipper_core import AutoClipperCore
-        default_prompt = AutoClipperCore.get_default_prompt()
+        default_prompt = self._get_default_prompt()
+        if self.system_message_textbox.get("1.0", "end-1c") == default_prompt:
+            return  # Already the default - skip the full re-layout
         self.system_message_textbox.delete("1.0", "end")
         self.system_message_textbox.insert("1.0", default_prompt)
     
@@ -37,10 +52,10 @@ class HighlightFinderSettingsPage(BaseProviderSettingsPage):
         info_frame.pack(fill="x", pady=(0, 10))
         
         ctk.CTkLabel(info_frame, text="🎯 About Highlight Finder", 
-            font=ctk.CTkFont(size=11, weight="bold")).pack(anchor="w", padx=12, pady=(10, 5))
+            font=shared_font(11, "bold")).pack(anchor="w", padx=12, pady=(10, 5))
         ctk.CTkLabel(info_frame, 
             text="Uses GPT models to analyze video transcripts and find\nthe most engaging moments for short-form content.", 
-            font=ctk.CTkFont(size=10), text_color="gray", justify="left").pack(anchor="w", padx=12, pady=(0, 10))
+            font=shared_font(10), text_color="gray", justify="left").pack(anchor="w", padx=12, pady=(0, 10))
         
         # Call parent to create standard fields
         super().create_provider_content()
@@ -52,11 +67,11 @@ class HighlightFinderSettingsPage(BaseProviderSettingsPage):
         system_frame.pack(fill="x", padx=15, pady=(0, 12))
         
         ctk.CTkLabel(system_frame, text="System Prompt for Highlight Detection", 
-            font=ctk.CTkFont(size=11)).pack(anchor="w")
+            font=shared_font(11)).pack(anchor="w")
         
         ctk.CTkLabel(system_frame, 
             text="Customize the AI instructions for finding highlights. Use placeholders:\n{num_clips}, {video_context}, {transcript}", 
-            font=ctk.CTkFont(size=9), text_color="gray", justify="left").pack(anchor="w", pady=(2, 5))
+            font=shared_font(9), text_color="gray", justify="left").pack(anchor="w", pady=(2, 5))
         
         # Create scrollable textbox for system message
         self.system_message_textbox = ctk.CTkTextbox(system_frame, height=200, wrap="word")
@@ -67,3 +82,14 @@ class HighlightFinderSettingsPage(BaseProviderSettingsPage):
             fg_color=("gray70", "gray30"), hover_color=("gray60", "gray40"),
             command=self._reset_system_message)
         reset_btn.pack(fill="x", pady=(5, 0))
+    
+    def save_settings(self):
+        """Warn about missing prompt placeholders, then save"""
+        system_message = self.system_message_textbox.get("1.0", "end-1c")
+        if system_message.strip():
+            missing = [p for p in self.REQUIRED_PLACEHOLDERS if p not in system_message]
+            if missing:
+                messagebox.showwarning("Warning", 
+                    f"System prompt missing placeholders: {', '.join(missing)}\n\nPrompt might not work correctly.")
+        
+        super().save_settings()
@@ -5,6 +5,7 @@ Title Generator Settings Page
 import customtkinter as ctk
 
 from pages.settings.ai_providers.base_provider import BaseProviderSettingsPage
+from components.page_layout import shared_font
 
 
 class TitleGeneratorSettingsPage(BaseProviderSettingsPage):
@@ -30,10 +31,10 @@ class TitleGeneratorSettingsPage(BaseProviderSettingsPage):
         info_frame.pack(fill="x", pady=(0, 10))
         
         ctk.CTkLabel(info_frame, text="📺 About Title Generator", 
-            font=ctk.CTkFont(size=11, weight="bold")).pack(anchor="w", padx=12, pady=(10, 5))
+            font=shared_font(11, "bold")).pack(anchor="w", padx=12, pady=(10, 5))
         ctk.CTkLabel(info_frame, 
             text="Uses GPT models to generate SEO-optimized titles,\ndescriptions, and tags for YouTube uploads.", 
-            font=ctk.CTkFont(size=10), text_color="gray", justify="left").pack(anchor="w", padx=12, pady=(0, 10))
+            font=shared_font(10), text_color="gray", justify="left").pack(anchor="w", padx=12, pady=(0, 10))
         
         # Call parent to create standard fields
         super().create_provider_content()
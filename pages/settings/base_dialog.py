@@ -2,8 +2,14 @@
 Base class for settings sub-pages (embedded in main window)
 """
 
+import webbrowser
+from collections import deque
 import customtkinter as ctk
 
+from components.page_layout import shared_font
+
+UI_PUMP_INTERVAL_MS = 16  # Max delay before queued worker-thread UI updates run
+
 
 class BaseSettingsSubPage(ctk.CTkFrame):
     """Base class for settings sub-pages"""
@@ -14,6 +20,9 @@ class BaseSettingsSubPage(ctk.CTkFrame):
         
         self.title = title
         self.on_back = on_back_callback
+        self._ui_queue = deque()  # UI callbacks posted by worker threads
+        self._ui_pump_scheduled = False
+        self._closed = False  # Set on destroy so late worker results are dropped
         
         # Create layout structure
         self._create_layout()
@@ -34,12 +43,33 @@ class BaseSettingsSubPage(ctk.CTkFrame):
         self.content = ctk.CTkScrollableFrame(self, fg_color="transparent")
         self.content.pack(fill="both", expand=True, padx=20, pady=(0, 10))
     
+    def destroy(self):
+        """Drop pending worker-thread UI updates before destroying the page"""
+        self._closed = True
+        self._ui_queue.clear()
+        super().destroy()
+    
+    def _post(self, callback):
+        """Queue a UI update from a worker thread; a burst runs in one Tk callback"""
+        if self._closed:
+            return  # Page was closed while the worker ran
+        self._ui_queue.append(callback)
+        if not self._ui_pump_scheduled:
+            self._ui_pump_scheduled = True
+            self.after(UI_PUMP_INTERVAL_MS, self._pump_ui)
+    
+    def _pump_ui(self):
+        """Run every queued UI update"""
+        self._ui_pump_scheduled = False  # Cleared first so a post during the drain reschedules
+        while self._ui_queue and not self._closed:
+            self._ui_queue.popleft()()
+    
     def create_section(self, title):
         """Create a section with title"""
         section = ctk.CTkFrame(self.content, fg_color=("gray90", "gray17"))
         section.pack(fill="x", pady=(0, 10))
         
-        ctk.CTkLabel(section, text=title, font=ctk.CTkFont(size=13, weight="bold")).pack(
+        ctk.CTkLabel(section, text=title, font=shared_font(13, "bold")).pack(
             anchor="w", padx=15, pady=(12, 8))
         
         return section
@@ -49,7 +79,7 @@ class BaseSettingsSubPage(ctk.CTkFrame):
         row = ctk.CTkFrame(parent, fg_color="transparent")
         row.pack(fill="x", padx=15, pady=(0, 10))
         
-        ctk.CTkLabel(row, text=label, font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(row, text=label, font=shared_font(11)).pack(anchor="w")
         
         entry = ctk.CTkEntry(row, placeholder_text=placeholder, show=show, height=36, width=width)
         entry.pack(fill="x", pady=(5, 0))
@@ -61,7 +91,7 @@ class BaseSettingsSubPage(ctk.CTkFrame):
         row = ctk.CTkFrame(parent, fg_color="transparent")
         row.pack(fill="x", padx=15, pady=(0, 10))
         
-        ctk.CTkLabel(row, text=label, font=ctk.CTkFont(size=11)).pack(anchor="w")
+        ctk.CTkLabel(row, text=label, font=shared_font(11)).pack(anchor="w")
         
         dropdown = ctk.CTkOptionMenu(row, values=values, variable=variable, height=36)
         dropdown.pack(fill="x", pady=(5, 0))
@@ -71,18 +101,16 @@ class BaseSettingsSubPage(ctk.CTkFrame):
     def create_save_button(self, command, text="💾 Save Settings"):
         """Create save button at bottom of content"""
         ctk.CTkButton(self.content, text=text, height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=shared_font(14, "bold"),
             fg_color=("#27ae60", "#27ae60"), hover_color=("#229954", "#229954"),
             command=command).pack(fill="x", pady=(10, 0))
     
     def open_github(self):
         """Open GitHub repository"""
-        import webbrowser
         webbrowser.open("https://github.com/jipraks/yt-short-clipper")
     
     def open_discord(self):
         """Open Discord server"""
-        import webbrowser
         webbrowser.open("https://s.id/ytsdiscord")
     
     def show_page(self, page_name):
@@ -93,5 +121,5 @@ class BaseSettingsSubPage(ctk.CTkFrame):
                 parent = parent.master
             if parent and hasattr(parent, 'show_page'):
                 parent.show_page(page_name)
-        except:
+        except Exception:
             pass
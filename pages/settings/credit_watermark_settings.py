@@ -8,6 +8,7 @@ from tkinter import messagebox
 import tkinter as tk
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
 
 
 class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
@@ -35,7 +36,7 @@ class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
         self.credit_enabled = ctk.BooleanVar(value=False)
         ctk.CTkSwitch(enable_frame, text="Enable Credit Watermark", 
             variable=self.credit_enabled,
-            font=ctk.CTkFont(size=14, weight="bold"), 
+            font=shared_font(14, "bold"), 
             command=self.toggle_credit).pack(side="left")
         
         # Credit settings container
@@ -45,14 +46,14 @@ class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
         # Info text
         ctk.CTkLabel(self.credit_settings_frame, 
             text="Automatically adds channel name as credit text on generated clips", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", pady=(0, 15))
+            font=shared_font(11), text_color="gray").pack(anchor="w", pady=(0, 15))
         
         # Position simulator with Canvas
         ctk.CTkLabel(self.credit_settings_frame, text="Position", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(10, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(10, 5))
         ctk.CTkLabel(self.credit_settings_frame, 
             text="Drag the text to position it on the video", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", pady=(0, 10))
+            font=shared_font(11), text_color="gray").pack(anchor="w", pady=(0, 10))
         
         # Canvas for 9:16 simulator
         self.canvas_frame = ctk.CTkFrame(self.credit_settings_frame, 
@@ -79,7 +80,7 @@ class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
         
         # Size slider
         ctk.CTkLabel(self.credit_settings_frame, text="Text Size", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(10, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(10, 5))
         
         size_frame = ctk.CTkFrame(self.credit_settings_frame, fg_color="transparent")
         size_frame.pack(fill="x", pady=(5, 15))
@@ -95,7 +96,7 @@ class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
         
         # Opacity slider
         ctk.CTkLabel(self.credit_settings_frame, text="Opacity", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(10, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(10, 5))
         
         opacity_frame = ctk.CTkFrame(self.credit_settings_frame, fg_color="transparent")
         opacity_frame.pack(fill="x", pady=(5, 15))
@@ -141,22 +142,19 @@ class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
             except Exception:
                 try:
                     self._set_children_state(child, state)
-                except:
+                except Exception:
                     pass
     
     def update_preview(self, *args):
         """Update text preview on canvas"""
-        # Update labels
-        size_percent = int(self.credit_size.get() * 100)
-        self.size_label.configure(text=f"{size_percent}%")
-        
-        opacity_percent = int(self.credit_opacity.get() * 100)
-        self.opacity_label.configure(text=f"{opacity_percent}%")
+        # Update labels (sliders fire on every pixel of movement, so skip unchanged text)
+        size_text = f"{int(self.credit_size.get() * 100)}%"
+        if self.size_label.cget("text") != size_text:
+            self.size_label.configure(text=size_text)
         
-        # Clear previous text
-        if self.text_item:
-            self.canvas.delete(self.text_item)
-            self.text_item = None
+        opacity_text = f"{int(self.credit_opacity.get() * 100)}%"
+        if self.opacity_label.cget("text") != opacity_text:
+            self.opacity_label.configure(text=opacity_text)
         
         # Calculate font size based on canvas (270x480 represents 1080x1920)
         # Scale factor: 270/1080 = 0.25
@@ -172,6 +170,12 @@ class CreditWatermarkSettingsSubPage(BaseSettingsSubPage):
         x = int(self.credit_x.get() * 270)
         y = int(self.credit_y.get() * 480)
         
+        # Move and restyle the existing text instead of recreating it
+        if self.text_item:
+            self.canvas.coords(self.text_item, x, y)
+            self.canvas.itemconfigure(self.text_item, fill=text_color, font=("Arial", font_size))
+            return
+        
         # Draw text
         self.text_item = self.canvas.create_text(
             x, y,
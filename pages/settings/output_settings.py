@@ -2,11 +2,23 @@
 Output Settings Sub-Page
 """
 
+import os
+import sys
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from pathlib import Path
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from utils.helpers import spawn_detached
+from components.page_layout import shared_font
+
+# File-manager opener, resolved once for this platform (none of them wait for the window)
+if sys.platform == "win32":
+    _open_folder = os.startfile
+elif sys.platform == "darwin":
+    _open_folder = lambda path: spawn_detached(["open", path])
+else:
+    _open_folder = lambda path: spawn_detached(["xdg-open", path])
 
 
 class OutputSettingsSubPage(BaseSettingsSubPage):
@@ -31,13 +43,13 @@ class OutputSettingsSubPage(BaseSettingsSubPage):
         folder_frame.pack(fill="x", padx=15, pady=(0, 12))
         
         ctk.CTkLabel(folder_frame, text="Folder where video clips will be saved", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", pady=(0, 5))
+            font=shared_font(11), text_color="gray").pack(anchor="w", pady=(0, 5))
         
         path_row = ctk.CTkFrame(folder_frame, fg_color="transparent")
         path_row.pack(fill="x")
         
-        self.output_var = ctk.StringVar(value=str(self.output_dir))
-        self.output_entry = ctk.CTkEntry(path_row, textvariable=self.output_var, height=36)
+        self.output_entry = ctk.CTkEntry(path_row, height=36)
+        self.output_entry.insert(0, str(self.output_dir))
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(path_row, text="Browse", width=100, height=36,
@@ -54,7 +66,7 @@ class OutputSettingsSubPage(BaseSettingsSubPage):
         tracking_frame.pack(fill="x", padx=15, pady=(0, 12))
         
         ctk.CTkLabel(tracking_frame, text="Choose how the video crops to speakers", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", pady=(0, 10))
+            font=shared_font(11), text_color="gray").pack(anchor="w", pady=(0, 10))
         
         self.face_tracking_var = ctk.StringVar(value="opencv")
         
@@ -64,15 +76,12 @@ class OutputSettingsSubPage(BaseSettingsSubPage):
         
         opencv_radio = ctk.CTkRadioButton(opencv_frame, text="OpenCV (Fast)", 
             variable=self.face_tracking_var, value="opencv", 
-            font=ctk.CTkFont(size=13, weight="bold"))
+            font=shared_font(13, "bold"))
         opencv_radio.pack(anchor="w", padx=15, pady=(10, 5))
         
-        ctk.CTkLabel(opencv_frame, text="• Crop to largest face", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", padx=35)
-        ctk.CTkLabel(opencv_frame, text="• Faster processing", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", padx=35)
-        ctk.CTkLabel(opencv_frame, text="• Recommended for most users", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", padx=35, pady=(0, 10))
+        ctk.CTkLabel(opencv_frame, 
+            text="• Crop to largest face\n• Faster processing\n• Recommended for most users", 
+            font=shared_font(11), text_color="gray", justify="left").pack(anchor="w", padx=35, pady=(0, 10))
         
         # MediaPipe option
         mediapipe_frame = ctk.CTkFrame(tracking_frame, fg_color=("gray85", "gray20"), corner_radius=8)
@@ -80,43 +89,39 @@ class OutputSettingsSubPage(BaseSettingsSubPage):
         
         mediapipe_radio = ctk.CTkRadioButton(mediapipe_frame, text="MediaPipe (Smart)", 
             variable=self.face_tracking_var, value="mediapipe", 
-            font=ctk.CTkFont(size=13, weight="bold"))
+            font=shared_font(13, "bold"))
         mediapipe_radio.pack(anchor="w", padx=15, pady=(10, 5))
         
-        ctk.CTkLabel(mediapipe_frame, text="• Crop to active speaker (lip movement)", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", padx=35)
-        ctk.CTkLabel(mediapipe_frame, text="• More accurate speaker tracking", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", padx=35)
+        ctk.CTkLabel(mediapipe_frame, 
+            text="• Crop to active speaker (lip movement)\n• More accurate speaker tracking", 
+            font=shared_font(11), text_color="gray", justify="left").pack(anchor="w", padx=35)
         ctk.CTkLabel(mediapipe_frame, text="⚠ Slower processing (2-3x)", 
-            font=ctk.CTkFont(size=11), text_color="orange").pack(anchor="w", padx=35, pady=(0, 10))
+            font=shared_font(11), text_color="orange").pack(anchor="w", padx=35, pady=(0, 10))
         
         # Save button
         self.create_save_button(self.save_settings)
     
+    def _set_output_dir(self, path):
+        """Replace the output folder entry text"""
+        self.output_entry.delete(0, "end")
+        self.output_entry.insert(0, path)
+    
     def browse_output_folder(self):
         """Browse for output folder"""
-        dir_path = filedialog.askdirectory(initialdir=self.output_var.get())
+        dir_path = filedialog.askdirectory(initialdir=self.output_entry.get())
         if dir_path:
-            self.output_var.set(dir_path)
+            self._set_output_dir(dir_path)
     
     def open_output_folder(self):
         """Open output folder in file explorer"""
-        import subprocess
-        import sys
-        
-        folder = self.output_var.get()
+        folder = self.output_entry.get()
         if not folder or not Path(folder).exists():
             messagebox.showwarning("Warning", "Output folder does not exist")
             return
         
         try:
-            if sys.platform == "win32":
-                subprocess.run(["explorer", folder])
-            elif sys.platform == "darwin":
-                subprocess.run(["open", folder])
-            else:
-                subprocess.run(["xdg-open", folder])
-        except Exception as e:
+            _open_folder(folder)
+        except OSError as e:
             messagebox.showerror("Error", f"Failed to open folder: {str(e)}")
     
     def load_config(self):
@@ -129,7 +134,8 @@ class OutputSettingsSubPage(BaseSettingsSubPage):
         
         # Output directory
         output_dir = config_dict.get("output_dir", str(self.output_dir))
-        self.output_var.set(output_dir)
+        self._loaded_output_dir = output_dir
+        self._set_output_dir(output_dir)
         
         # Face tracking mode
         face_tracking = config_dict.get("face_tracking_mode", "opencv")
@@ -137,18 +143,19 @@ class OutputSettingsSubPage(BaseSettingsSubPage):
     
     def save_settings(self):
         """Save settings"""
-        output_dir = self.output_var.get().strip()
+        output_dir = self.output_entry.get().strip()
         
         if not output_dir:
             messagebox.showerror("Error", "Output directory is required")
             return
         
-        # Create directory if it doesn't exist
-        try:
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Cannot create directory:\n{str(e)}")
-            return
+        # Create directory if it doesn't exist (an unchanged folder only needs a stat)
+        if output_dir != self._loaded_output_dir or not Path(output_dir).is_dir():
+            try:
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                messagebox.showerror("Error", f"Cannot create directory:\n{str(e)}")
+                return
         
         # Handle both ConfigManager and dict
         if hasattr(self.config, 'config'):
@@ -7,6 +7,7 @@ import customtkinter as ctk
 from tkinter import messagebox
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
 
 
 class PerformanceSettingsSubPage(BaseSettingsSubPage):
@@ -37,7 +38,7 @@ class PerformanceSettingsSubPage(BaseSettingsSubPage):
         self.gpu_info_frame.pack(fill="x", pady=(0, 10))
         
         self.gpu_status_label = ctk.CTkLabel(self.gpu_info_frame, text="Detecting GPU...", 
-            font=ctk.CTkFont(size=11), anchor="w", justify="left")
+            font=shared_font(11), anchor="w", justify="left")
         self.gpu_status_label.pack(fill="x", padx=12, pady=12)
         
         # Detect button
@@ -53,13 +54,13 @@ class PerformanceSettingsSubPage(BaseSettingsSubPage):
         
         self.gpu_enabled_var = ctk.BooleanVar(value=False)
         self.gpu_switch = ctk.CTkSwitch(accel_frame, text="Enable GPU Acceleration", 
-            variable=self.gpu_enabled_var, font=ctk.CTkFont(size=12),
+            variable=self.gpu_enabled_var, font=shared_font(12),
             command=self.toggle_gpu_acceleration, state="disabled")
         self.gpu_switch.pack(anchor="w", pady=(0, 10))
         
         ctk.CTkLabel(accel_frame, 
             text="GPU encoding is 3-5x faster than CPU. Requires compatible hardware.",
-            font=ctk.CTkFont(size=10), text_color="gray", anchor="w", justify="left").pack(fill="x")
+            font=shared_font(10), text_color="gray", anchor="w", justify="left").pack(fill="x")
         
         # Technical Details Section
         details_section = self.create_section("Technical Details")
@@ -69,7 +70,7 @@ class PerformanceSettingsSubPage(BaseSettingsSubPage):
         
         self.encoder_info_label = ctk.CTkLabel(details_frame, 
             text="Encoder: Not detected\nPreset: N/A\nStatus: Click 'Detect GPU' to check",
-            font=ctk.CTkFont(size=10), text_color="gray", anchor="w", justify="left")
+            font=shared_font(10), text_color="gray", anchor="w", justify="left")
         self.encoder_info_label.pack(fill="x")
         
         # Save button
@@ -87,10 +88,10 @@ class PerformanceSettingsSubPage(BaseSettingsSubPage):
                 gpu_info = detector.detect_gpu()
                 recommendation = detector.get_recommended_encoder()
                 
-                self.after(0, lambda g=gpu_info, r=recommendation: self._on_gpu_detected(g, r))
+                self._post(lambda g=gpu_info, r=recommendation: self._on_gpu_detected(g, r))
             except Exception as e:
                 error_msg = str(e)
-                self.after(0, lambda err=error_msg: self._on_gpu_detect_error(err))
+                self._post(lambda err=error_msg: self._on_gpu_detect_error(err))
         
         threading.Thread(target=do_detect, daemon=True).start()
     
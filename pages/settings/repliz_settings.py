@@ -8,6 +8,7 @@ import customtkinter as ctk
 from tkinter import messagebox
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
 
 
 class ReplizSettingsSubPage(BaseSettingsSubPage):
@@ -29,7 +30,7 @@ class ReplizSettingsSubPage(BaseSettingsSubPage):
         why_card.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(why_card, text="Why Use Repliz?", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=15, pady=(15, 10))
+            font=shared_font(13, "bold")).pack(anchor="w", padx=15, pady=(15, 10))
         
         why_text = """Upload to ALL platforms at once (YouTube, TikTok, Instagram, Facebook)
 Official API integration - safe from bans
@@ -38,18 +39,18 @@ Schedule posts in advance across all platforms
 Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         
         ctk.CTkLabel(why_card, text=why_text, justify="left",
-            font=ctk.CTkFont(size=11), wraplength=480).pack(anchor="w", padx=15, pady=(0, 15))
+            font=shared_font(11), wraplength=480).pack(anchor="w", padx=15, pady=(0, 15))
         
         # Sign up CTA
         signup_frame = ctk.CTkFrame(self.content, fg_color=("gray85", "gray20"), corner_radius=10)
         signup_frame.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(signup_frame, text="Don't Have a Repliz Account Yet?", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=15, pady=(15, 10))
+            font=shared_font(13, "bold")).pack(anchor="w", padx=15, pady=(15, 10))
         
         ctk.CTkLabel(signup_frame, 
             text="Sign up now and get started with multi-platform scheduling.",
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", padx=15, pady=(0, 10))
+            font=shared_font(11), text_color="gray").pack(anchor="w", padx=15, pady=(0, 10))
         
         ctk.CTkButton(signup_frame, text="Sign Up for Repliz", height=40,
             fg_color=("#2196F3", "#1976D2"), hover_color=("#1976D2", "#1565C0"),
@@ -63,10 +64,10 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         config_header.pack(fill="x", padx=15, pady=(15, 10))
         
         ctk.CTkLabel(config_header, text="API Configuration", 
-            font=ctk.CTkFont(size=14, weight="bold")).pack(side="left")
+            font=shared_font(14, "bold")).pack(side="left")
         
         self.repliz_status_label = ctk.CTkLabel(config_header, text="Not configured", 
-            text_color="gray", font=ctk.CTkFont(size=11))
+            text_color="gray", font=shared_font(11))
         self.repliz_status_label.pack(side="right")
         
         # Access Key
@@ -74,9 +75,9 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         access_frame.pack(fill="x", padx=15, pady=(0, 15))
         
         ctk.CTkLabel(access_frame, text="Access Key", 
-            font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w")
+            font=shared_font(12, "bold")).pack(anchor="w")
         ctk.CTkLabel(access_frame, text="Your Repliz API Access Key", 
-            font=ctk.CTkFont(size=10), text_color="gray").pack(anchor="w", pady=(2, 5))
+            font=shared_font(10), text_color="gray").pack(anchor="w", pady=(2, 5))
         
         self.access_key_entry = ctk.CTkEntry(access_frame, height=38,
             placeholder_text="Enter your Repliz Access Key")
@@ -87,9 +88,9 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         secret_frame.pack(fill="x", padx=15, pady=(0, 15))
         
         ctk.CTkLabel(secret_frame, text="Secret Key", 
-            font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w")
+            font=shared_font(12, "bold")).pack(anchor="w")
         ctk.CTkLabel(secret_frame, text="Your Repliz API Secret Key (kept secure)", 
-            font=ctk.CTkFont(size=10), text_color="gray").pack(anchor="w", pady=(2, 5))
+            font=shared_font(10), text_color="gray").pack(anchor="w", pady=(2, 5))
         
         self.secret_key_entry = ctk.CTkEntry(secret_frame, height=38, show="*",
             placeholder_text="Enter your Repliz Secret Key")
@@ -110,10 +111,10 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         accounts_header.pack(fill="x", padx=15, pady=(15, 10))
         
         ctk.CTkLabel(accounts_header, text="Connected Social Media Accounts", 
-            font=ctk.CTkFont(size=14, weight="bold")).pack(side="left")
+            font=shared_font(14, "bold")).pack(side="left")
         
         self.accounts_count = ctk.CTkLabel(accounts_header, text="0 accounts", 
-            text_color="gray", font=ctk.CTkFont(size=11))
+            text_color="gray", font=shared_font(11))
         self.accounts_count.pack(side="right")
         
         self.accounts_list = ctk.CTkFrame(self.accounts_section, fg_color="transparent")
@@ -176,7 +177,7 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
                 
                 if response.status_code == 200:
                     data = response.json()
-                    self.after(0, lambda d=data: self._display_accounts(d, show_popup=False))
+                    self._post(lambda d=data: self._display_accounts(d, show_popup=False))
                     
             except Exception:
                 pass
@@ -212,19 +213,20 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
                 
                 if response.status_code == 200:
                     data = response.json()
-                    self.after(0, lambda d=data: self._on_validate_success(d))
+                    self._post(lambda d=data: self._on_validate_success(d))
                 else:
                     error_msg = f"HTTP {response.status_code}"
                     try:
                         error_data = response.json()
                         error_msg = error_data.get("message", error_msg)
-                    except:
+                    except (ValueError, AttributeError):
+                        # Body isn't a JSON object
                         if response.status_code == 401:
                             error_msg = "Invalid authorization header"
-                    self.after(0, lambda e=error_msg: self._on_validate_error(e))
+                    self._post(lambda e=error_msg: self._on_validate_error(e))
                     
             except Exception as e:
-                self.after(0, lambda err=str(e): self._on_validate_error(err))
+                self._post(lambda err=str(e): self._on_validate_error(err))
         
         threading.Thread(target=do_validate, daemon=True).start()
     
@@ -291,10 +293,10 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         if picture_url:
             self._load_profile_picture(card, picture_url, icon)
         else:
-            ctk.CTkLabel(card, text=icon, font=ctk.CTkFont(size=48)).pack(pady=(15, 5))
+            ctk.CTkLabel(card, text=icon, font=shared_font(48)).pack(pady=(15, 5))
         
         ctk.CTkLabel(card, text=platform_type.upper(), 
-            font=ctk.CTkFont(size=9, weight="bold"),
+            font=shared_font(9, "bold"),
             fg_color=("gray80", "gray30"), corner_radius=4,
             padx=8, pady=2).pack(pady=(5, 5))
         
@@ -303,7 +305,7 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
             account_name = account_name[:13] + "..."
         
         ctk.CTkLabel(card, text=account_name,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=shared_font(12, "bold"),
             wraplength=140).pack(pady=(0, 2))
         
         username = account.get("username", "")
@@ -312,7 +314,7 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
                 username = username[:16] + "..."
             username_text = f"@{username}" if not username.startswith("@") else username
             ctk.CTkLabel(card, text=username_text,
-                font=ctk.CTkFont(size=10), text_color="gray",
+                font=shared_font(10), text_color="gray",
                 wraplength=140).pack(pady=(0, 8))
         
         is_connected = account.get("isConnected", False)
@@ -320,7 +322,7 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
         status_color = ("green", "green") if is_connected else ("red", "red")
         
         ctk.CTkLabel(card, text=status_text,
-            font=ctk.CTkFont(size=9, weight="bold"),
+            font=shared_font(9, "bold"),
             text_color="white", fg_color=status_color,
             corner_radius=4, padx=10, pady=4).pack(side="bottom", pady=(0, 10))
     
@@ -350,14 +352,14 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
                     from customtkinter import CTkImage
                     ctk_img = CTkImage(light_image=output, dark_image=output, size=(80, 80))
                     
-                    self.after(0, lambda p=parent, img=ctk_img: self._display_profile_picture(p, img))
+                    self._post(lambda p=parent, img=ctk_img: self._display_profile_picture(p, img))
                 else:
-                    self.after(0, lambda p=parent, icon=fallback_icon: self._display_fallback_icon(p, icon))
+                    self._post(lambda p=parent, icon=fallback_icon: self._display_fallback_icon(p, icon))
                     
             except Exception:
-                self.after(0, lambda p=parent, icon=fallback_icon: self._display_fallback_icon(p, icon))
+                self._post(lambda p=parent, icon=fallback_icon: self._display_fallback_icon(p, icon))
         
-        ctk.CTkLabel(parent, text="...", font=ctk.CTkFont(size=40)).pack(pady=(15, 5))
+        ctk.CTkLabel(parent, text="...", font=shared_font(40)).pack(pady=(15, 5))
         threading.Thread(target=do_load, daemon=True).start()
     
     def _display_profile_picture(self, parent, ctk_img):
@@ -376,7 +378,7 @@ Affordable: Only $1.74/month (29,000 IDR) for Premium plan"""
                 widget.destroy()
                 break
         
-        ctk.CTkLabel(parent, text=icon, font=ctk.CTkFont(size=48)).pack(pady=(15, 5))
+        ctk.CTkLabel(parent, text=icon, font=shared_font(48)).pack(pady=(15, 5))
     
     def save_settings(self):
         """Save Repliz settings"""
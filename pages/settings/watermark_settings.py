@@ -9,6 +9,7 @@ from pathlib import Path
 import tkinter as tk
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
 
 
 class WatermarkSettingsSubPage(BaseSettingsSubPage):
@@ -19,6 +20,7 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
         self.on_save_callback = on_save_callback
         self.watermark_item = None
         self.watermark_photo = None
+        self._preview_key = None  # (path, scale, opacity) of the image on the canvas
         self.dragging = False
         self.drag_offset_x = 0
         self.drag_offset_y = 0
@@ -37,7 +39,7 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
         self.watermark_enabled = ctk.BooleanVar(value=False)
         ctk.CTkSwitch(enable_frame, text="Enable Watermark", 
             variable=self.watermark_enabled,
-            font=ctk.CTkFont(size=14, weight="bold"), 
+            font=shared_font(14, "bold"), 
             command=self.toggle_watermark).pack(side="left")
         
         # Watermark settings container
@@ -46,7 +48,7 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
         
         # Image selection
         ctk.CTkLabel(self.watermark_settings_frame, text="Watermark Image", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(5, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(5, 5))
         
         image_frame = ctk.CTkFrame(self.watermark_settings_frame, fg_color="transparent")
         image_frame.pack(fill="x", pady=(5, 15))
@@ -62,10 +64,10 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
         
         # Position simulator with Canvas
         ctk.CTkLabel(self.watermark_settings_frame, text="Position", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(10, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(10, 5))
         ctk.CTkLabel(self.watermark_settings_frame, 
             text="Drag the watermark to position it on the video", 
-            font=ctk.CTkFont(size=11), text_color="gray").pack(anchor="w", pady=(0, 10))
+            font=shared_font(11), text_color="gray").pack(anchor="w", pady=(0, 10))
         
         # Canvas for 9:16 simulator
         self.canvas_frame = ctk.CTkFrame(self.watermark_settings_frame, 
@@ -92,7 +94,7 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
         
         # Opacity slider
         ctk.CTkLabel(self.watermark_settings_frame, text="Opacity", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(10, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(10, 5))
         
         opacity_frame = ctk.CTkFrame(self.watermark_settings_frame, fg_color="transparent")
         opacity_frame.pack(fill="x", pady=(5, 15))
@@ -108,7 +110,7 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
         
         # Scale slider
         ctk.CTkLabel(self.watermark_settings_frame, text="Size", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", pady=(10, 5))
+            font=shared_font(13, "bold")).pack(anchor="w", pady=(10, 5))
         
         scale_frame = ctk.CTkFrame(self.watermark_settings_frame, fg_color="transparent")
         scale_frame.pack(fill="x", pady=(5, 15))
@@ -146,10 +148,10 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
             try:
                 if hasattr(child, 'configure'):
                     child.configure(state=state)
-            except:
+            except Exception:
                 try:
                     self._set_children_state(child, state)
-                except:
+                except Exception:
                     pass
     
     def browse_watermark(self):
@@ -179,14 +181,29 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
     
     def update_watermark_preview(self, *args):
         """Update watermark preview on canvas"""
-        self.opacity_label.configure(text=f"{int(self.watermark_opacity.get() * 100)}%")
-        self.scale_label.configure(text=f"{int(self.watermark_scale.get() * 100)}%")
+        opacity = self.watermark_opacity.get()
+        scale = self.watermark_scale.get()
+        # Sliders fire on every pixel of movement; only relabel when the value changes
+        opacity_text = f"{int(opacity * 100)}%"
+        if self.opacity_label.cget("text") != opacity_text:
+            self.opacity_label.configure(text=opacity_text)
+        scale_text = f"{int(scale * 100)}%"
+        if self.scale_label.cget("text") != scale_text:
+            self.scale_label.configure(text=scale_text)
+        
+        watermark_path = self.watermark_path_var.get()
+        x = int(self.watermark_x.get() * 270)
+        y = int(self.watermark_y.get() * 480)
+        preview_key = (watermark_path, scale, opacity)
+        if self.watermark_item and preview_key == self._preview_key:
+            # Same image - just move it
+            self.canvas.coords(self.watermark_item, x, y)
+            return
         
         if self.watermark_item:
             self.canvas.delete(self.watermark_item)
             self.watermark_item = None
         
-        watermark_path = self.watermark_path_var.get()
         if not watermark_path or not Path(watermark_path).exists():
             return
         
@@ -194,19 +211,18 @@ class WatermarkSettingsSubPage(BaseSettingsSubPage):
             from PIL import Image, ImageTk
             img = Image.open(watermark_path)
             canvas_width = 270
-            watermark_width = int(canvas_width * self.watermark_scale.get())
+            watermark_width = int(canvas_width * scale)
             aspect_ratio = img.height / img.width
             watermark_height = int(watermark_width * aspect_ratio)
             img = img.resize((watermark_width, watermark_height), Image.Resampling.LANCZOS)
             if img.mode != 'RGBA':
                 img = img.convert('RGBA')
             alpha = img.split()[3]
-            alpha = alpha.point(lambda p: int(p * self.watermark_opacity.get()))
+            alpha = alpha.point(lambda p: int(p * opacity))
             img.putalpha(alpha)
             self.watermark_photo = ImageTk.PhotoImage(img)
-            x = int(self.watermark_x.get() * 270)
-            y = int(self.watermark_y.get() * 480)
             self.watermark_item = self.canvas.create_image(x, y, image=self.watermark_photo, anchor="nw")
+            self._preview_key = preview_key
         except Exception as e:
             print(f"Error loading watermark preview: {e}")
     
@@ -2,26 +2,42 @@
 YouTube API Settings Sub-Page
 """
 
+import time
 import threading
 import webbrowser
 import customtkinter as ctk
 from tkinter import messagebox
 
 from pages.settings.base_dialog import BaseSettingsSubPage
+from components.page_layout import shared_font
+
+STATUS_CACHE_TTL = 300  # Seconds a remembered connection status is trusted without re-checking
 
 
 class YouTubeAPISettingsSubPage(BaseSettingsSubPage):
     """Sub-page for configuring YouTube API OAuth"""
     
+    # Shared across page opens so reopening doesn't re-import, re-auth or re-query the channel
+    _shared_uploader = None
+    _status_cache = None  # Last (status, channel, credentials mtime, time) from a settled check
+    
     def __init__(self, parent, config, on_save_callback, on_back_callback):
         self.config = config
         self.on_save_callback = on_save_callback
-        self.youtube_uploader = None
+        self.youtube_uploader = YouTubeAPISettingsSubPage._shared_uploader
         
         super().__init__(parent, "YouTube API Settings", on_back_callback)
         
+        # Main app's connection indicator refresh, looked up once instead of on every connect/disconnect
+        self._update_connection_status = self._find_app_callback("update_connection_status")
+        
         self.create_content()
-        self.check_status()
+        cached = YouTubeAPISettingsSubPage._status_cache
+        if (cached and cached[2] == self._credentials_mtime()
+                and time.monotonic() - cached[3] < STATUS_CACHE_TTL):
+            self._update_status(cached[0], cached[1])
+        else:
+            self.check_status()
     
     def create_content(self):
         """Create page content"""
@@ -30,10 +46,10 @@ class YouTubeAPISettingsSubPage(BaseSettingsSubPage):
         header_frame.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(header_frame, text="YouTube", 
-            font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+            font=shared_font(16, "bold")).pack(side="left")
         
         self.status_badge = ctk.CTkLabel(header_frame, text="Not connected", 
-            text_color="gray", font=ctk.CTkFont(size=11))
+            text_color="gray", font=shared_font(11))
         self.status_badge.pack(side="right")
         
         # Connection Status Section
@@ -41,17 +57,17 @@ class YouTubeAPISettingsSubPage(BaseSettingsSubPage):
         status_section.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(status_section, text="Connection Status", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=15, pady=(15, 10))
+            font=shared_font(13, "bold")).pack(anchor="w", padx=15, pady=(15, 10))
         
         status_frame = ctk.CTkFrame(status_section, fg_color="transparent")
         status_frame.pack(fill="x", padx=15, pady=(0, 15))
         
         self.status_label = ctk.CTkLabel(status_frame, text="Checking...", 
-            font=ctk.CTkFont(size=12), text_color="gray")
+            font=shared_font(12), text_color="gray")
         self.status_label.pack(anchor="w")
         
         self.channel_label = ctk.CTkLabel(status_frame, text="", 
-            font=ctk.CTkFont(size=11), text_color="gray")
+            font=shared_font(11), text_color="gray")
         self.channel_label.pack(anchor="w", pady=(5, 0))
         
         # Action Buttons
@@ -73,7 +89,7 @@ class YouTubeAPISettingsSubPage(BaseSettingsSubPage):
         info_section.pack(fill="x", pady=(0, 15))
         
         ctk.CTkLabel(info_section, text="Setup Instructions", 
-            font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=15, pady=(15, 10))
+            font=shared_font(13, "bold")).pack(anchor="w", padx=15, pady=(15, 10))
         
         info_text = """1. Set up Google Cloud project
 2. Enable YouTube Data API v3
@@ -83,40 +99,65 @@ class YouTubeAPISettingsSubPage(BaseSettingsSubPage):
 See README for detailed setup guide."""
         
         ctk.CTkLabel(info_section, text=info_text, justify="left", anchor="w",
-            font=ctk.CTkFont(size=11), text_color="gray", wraplength=450).pack(anchor="w", padx=15, pady=(0, 15))
+            font=shared_font(11), text_color="gray", wraplength=450).pack(anchor="w", padx=15, pady=(0, 15))
         
         # Open Google Console button
         ctk.CTkButton(info_section, text="Open Google Cloud Console", height=38,
             fg_color="gray", hover_color=("gray70", "gray30"),
             command=lambda: webbrowser.open("https://console.cloud.google.com/")).pack(fill="x", padx=15, pady=(0, 15))
     
+    def _find_app_callback(self, name):
+        """Find a method on the nearest ancestor widget that has it, or None"""
+        parent = self.master
+        while parent is not None:
+            callback = getattr(parent, name, None)
+            if callback is not None:
+                return callback
+            parent = parent.master
+        return None
+    
     def check_status(self):
         """Check YouTube connection status"""
         def do_check():
             try:
                 from youtube_uploader import YouTubeUploader
                 self.youtube_uploader = YouTubeUploader()
+                YouTubeAPISettingsSubPage._shared_uploader = self.youtube_uploader
                 
                 if not self.youtube_uploader.is_configured():
-                    self.after(0, lambda: self._update_status("not_configured"))
+                    self._post(lambda: self._update_status("not_configured"))
                     return
                 
                 if self.youtube_uploader.is_authenticated():
                     channel = self.youtube_uploader.get_channel_info()
                     if channel:
-                        self.after(0, lambda c=channel: self._update_status("connected", c))
+                        self._post(lambda c=channel: self._remember_status("connected", c))
                     else:
-                        self.after(0, lambda: self._update_status("auth_error"))
+                        self._post(lambda: self._update_status("auth_error"))
                 else:
-                    self.after(0, lambda: self._update_status("not_connected"))
+                    self._post(lambda: self._remember_status("not_connected"))
                     
             except ImportError:
-                self.after(0, lambda: self._update_status("module_error"))
+                self._post(lambda: self._update_status("module_error"))
             except Exception as e:
-                self.after(0, lambda err=str(e): self._update_status("error", error=err))
+                self._post(lambda err=str(e): self._update_status("error", error=err))
         
         threading.Thread(target=do_check, daemon=True).start()
     
+    @staticmethod
+    def _credentials_mtime():
+        """mtime of the saved YouTube credentials file, or None if there is none"""
+        try:
+            from youtube_uploader import CREDENTIALS_FILE
+            return CREDENTIALS_FILE.stat().st_mtime
+        except (ImportError, OSError):
+            return None
+    
+    def _remember_status(self, status, channel=None):
+        """Show a settled connection status and keep it for the next page open"""
+        YouTubeAPISettingsSubPage._status_cache = (status, channel, self._credentials_mtime(), time.monotonic())
+        self._update_status(status, channel)
+    
     def _update_status(self, status, channel=None, error=None):
         """Update status display"""
         if status == "connected" and channel:
@@ -171,39 +212,33 @@ See README for detailed setup guide."""
                 if not self.youtube_uploader:
                     from youtube_uploader import YouTubeUploader
                     self.youtube_uploader = YouTubeUploader()
+                    YouTubeAPISettingsSubPage._shared_uploader = self.youtube_uploader
                 
                 self.youtube_uploader.authenticate(callback=self._on_auth_callback)
                     
             except Exception as e:
-                self.after(0, lambda err=str(e): self._on_connect_error(err))
+                self._post(lambda err=str(e): self._on_connect_error(err))
         
         threading.Thread(target=do_connect, daemon=True).start()
     
     def _on_auth_callback(self, success, data):
         """Handle authentication callback"""
         if success:
-            self.after(0, lambda d=data: self._on_connect_success(d))
+            self._post(lambda d=data: self._on_connect_success(d))
         else:
-            self.after(0, lambda err=str(data): self._on_connect_error(err))
+            self._post(lambda err=str(data): self._on_connect_error(err))
     
     def _on_connect_success(self, channel):
         """Handle successful connection"""
         self.connect_btn.configure(text="Connect YouTube")
-        self._update_status("connected", channel)
+        self._remember_status("connected", channel)
         
         channel_title = channel.get('title', 'Unknown') if channel else 'Unknown'
         messagebox.showinfo("Success", f"Connected to YouTube channel: {channel_title}")
         
         # Update main app status if available
-        try:
-            parent = self.master
-            while parent:
-                if hasattr(parent, 'update_connection_status'):
-                    parent.update_connection_status()
-                    break
-                parent = getattr(parent, 'master', None)
-        except:
-            pass
+        if self._update_connection_status:
+            self._update_connection_status()
     
     def _on_connect_error(self, error):
         """Handle connection error"""
@@ -225,20 +260,13 @@ See README for detailed setup guide."""
             if os.path.exists(creds_file):
                 os.remove(creds_file)
             
-            self._update_status("not_connected")
+            self._remember_status("not_connected")
             self.connect_btn.pack(fill="x", pady=(0, 10))
             messagebox.showinfo("Success", "YouTube account disconnected")
             
             # Update main app status if available
-            try:
-                parent = self.master
-                while parent:
-                    if hasattr(parent, 'update_connection_status'):
-                        parent.update_connection_status()
-                        break
-                    parent = getattr(parent, 'master', None)
-            except:
-                pass
+            if self._update_connection_status:
+                self._update_connection_status()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to disconnect:\n{str(e)}")
@@ -2,10 +2,12 @@
 Settings page for YT Short Clipper - Card-based layout with sub-pages
 """
 
+import webbrowser
 import customtkinter as ctk
 from tkinter import messagebox
 
 from version import __version__
+from components.page_layout import shared_font
 
 
 class SettingsPage(ctk.CTkFrame):
@@ -19,9 +21,9 @@ class SettingsPage(ctk.CTkFrame):
         self.output_dir = output_dir
         self.check_update = check_update_callback
         
-        # Container for switching between main and sub-pages
+        # Container that holds the open sub-page (the main card page is kept alongside it)
         self.container = ctk.CTkFrame(self, fg_color="transparent")
-        self.container.pack(fill="both", expand=True)
+        self.main_frame = None
         
         # Current sub-page
         self.current_subpage = None
@@ -29,15 +31,20 @@ class SettingsPage(ctk.CTkFrame):
         self.create_main_page()
     
     def create_main_page(self):
-        """Create the main settings page with cards"""
-        # Clear container
+        """Show the main settings page with cards, building it on first use"""
+        # Close any open sub-page
         for widget in self.container.winfo_children():
             widget.destroy()
+        self.container.pack_forget()
         
         self.current_subpage = None
         
+        if self.main_frame is not None:
+            self.main_frame.pack(fill="both", expand=True)
+            return
+        
         # Main frame
-        main_frame = ctk.CTkFrame(self.container, fg_color=("#1a1a1a", "#0a0a0a"))
+        main_frame = self.main_frame = ctk.CTkFrame(self, fg_color=("#1a1a1a", "#0a0a0a"))
         main_frame.pack(fill="both", expand=True)
         
         from components.page_layout import PageHeader, PageFooter
@@ -58,7 +65,7 @@ class SettingsPage(ctk.CTkFrame):
         cards_section = ctk.CTkFrame(main, fg_color=("gray90", "gray17"))
         cards_section.pack(fill="x", pady=(15, 10))
         
-        ctk.CTkLabel(cards_section, text="Settings", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w", padx=15, pady=(12, 8))
+        ctk.CTkLabel(cards_section, text="Settings", font=shared_font(14, "bold")).pack(anchor="w", padx=15, pady=(12, 8))
         
         # Cards grid - 4 cards per row
         cards_frame = ctk.CTkFrame(cards_section, fg_color="transparent")
@@ -86,17 +93,17 @@ class SettingsPage(ctk.CTkFrame):
         card.bind("<Button-1>", lambda e, k=page_key: self.navigate_to_subpage(k))
         
         # Icon
-        icon_label = ctk.CTkLabel(card, text=icon, font=ctk.CTkFont(size=24))
+        icon_label = ctk.CTkLabel(card, text=icon, font=shared_font(24))
         icon_label.pack(anchor="w", padx=12, pady=(12, 5))
         icon_label.bind("<Button-1>", lambda e, k=page_key: self.navigate_to_subpage(k))
         
         # Title
-        title_label = ctk.CTkLabel(card, text=title, font=ctk.CTkFont(size=12, weight="bold"))
+        title_label = ctk.CTkLabel(card, text=title, font=shared_font(12, "bold"))
         title_label.pack(anchor="w", padx=12)
         title_label.bind("<Button-1>", lambda e, k=page_key: self.navigate_to_subpage(k))
         
         # Description
-        desc_label = ctk.CTkLabel(card, text=description, font=ctk.CTkFont(size=9), text_color="gray")
+        desc_label = ctk.CTkLabel(card, text=description, font=shared_font(9), text_color="gray")
         desc_label.pack(anchor="w", padx=12, pady=(2, 12))
         desc_label.bind("<Button-1>", lambda e, k=page_key: self.navigate_to_subpage(k))
         
@@ -117,6 +124,10 @@ class SettingsPage(ctk.CTkFrame):
         for widget in self.container.winfo_children():
             widget.destroy()
         
+        # Hide (not destroy) the card page so going back doesn't rebuild it
+        self.main_frame.pack_forget()
+        self.container.pack(fill="both", expand=True)
+        
         self.current_subpage = page_key
         
         # Create sub-page based on key
@@ -155,8 +166,10 @@ class SettingsPage(ctk.CTkFrame):
                     self.config.config[key].update(value)
                 else:
                     self.config.config[key] = value
-            self.config.save()
-            print(f"[DEBUG] Config saved to file: {self.config.config_file}")
+            # The app's save handler writes the merged config, so only write here without one
+            if not self.on_save:
+                self.config.save()
+                print(f"[DEBUG] Config saved to file: {self.config.config_file}")
         else:
             # Fallback for dict config
             self.config.update(updated_config)
@@ -168,12 +181,10 @@ class SettingsPage(ctk.CTkFrame):
     
     def open_github(self):
         """Open GitHub repository"""
-        import webbrowser
         webbrowser.open("https://github.com/jipraks/yt-short-clipper")
     
     def open_discord(self):
         """Open Discord server"""
-        import webbrowser
         webbrowser.open("https://s.id/ytsdiscord")
     
     def show_page(self, page_name):
@@ -184,5 +195,5 @@ class SettingsPage(ctk.CTkFrame):
                 parent = parent.master
             if parent and hasattr(parent, 'show_page'):
                 parent.show_page(page_name)
-        except:
+        except Exception:
             pass
@@ -162,7 +162,7 @@ class APIStatusPage(ctk.CTkFrame):
         self.repliz_register_btn.pack_forget()
         
         def check_status():
-            from openai import OpenAI
+            from openai import OpenAI, NotFoundError
             
             # Get config
             config = self.get_config()
@@ -193,10 +193,17 @@ class APIStatusPage(ctk.CTkFrame):
                     client = OpenAI(api_key=api_key, base_url=base_url)
                     
                     try:
-                        models_response = client.models.list()
-                        available_models = [m.id for m in models_response.data]
+                        # Look up only the configured model (tiny response) with a tight
+                        # timeout instead of downloading the whole model list
+                        try:
+                            client.with_options(timeout=3.0).models.retrieve(model)
+                            model_found = True
+                        except NotFoundError:
+                            # Unknown model or provider without per-model lookup - check full list
+                            models_response = client.models.list()
+                            model_found = model in [m.id for m in models_response.data]
                         
-                        if model in available_models:
+                        if model_found:
                             self.after(0, lambda sl=status_label, il=info_label, m=model: (
                                 sl.configure(text="✓ Connected", text_color="green"),
                                 il.configure(text=f"Model: {m}")
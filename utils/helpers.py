@@ -2,10 +2,18 @@
 Helper utility functions for YT Short Clipper
 """
 
+import io
 import sys
 import re
 import shutil
+import subprocess
 from pathlib import Path
+from PIL import Image
+
+# Hide console window on Windows
+SUBPROCESS_FLAGS = 0
+if sys.platform == "win32":
+    SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW
 
 
 def get_app_dir():
@@ -22,6 +30,101 @@ def get_bundle_dir():
     return get_app_dir()
 
 
+# Optional libjpeg-turbo decoder for thumbnails
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _jpeg = None
+
+
+def decode_jpeg(data: bytes, size=None) -> Image.Image:
+    """Decode JPEG bytes, using libjpeg-turbo when it is installed
+    
+    When size is given the decoder may downscale (by 1/2, 1/4 or 1/8)
+    as long as the result still covers size.
+    """
+    if _jpeg is not None:
+        try:
+            scaling_factor = None
+            if size:
+                width, height = _jpeg.decode_header(data)[:2]
+                for num, den in ((1, 8), (1, 4), (1, 2)):
+                    if width * num // den >= size[0] and height * num // den >= size[1]:
+                        scaling_factor = (num, den)
+                        break
+            return Image.fromarray(_jpeg.decode(data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor))
+        except (OSError, ValueError):
+            pass  # Let PIL handle anything turbojpeg can't read
+    img = Image.open(io.BytesIO(data))
+    if size:
+        img.draft("RGB", size)
+    img.load()
+    return img
+
+
+def spawn_detached(args):
+    """Launch an external opener (open/xdg-open) without waiting for it to exit"""
+    subprocess.Popen(args, start_new_session=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def extract_thumbnail_jpeg(video_path, width: int, height: int):
+    """Grab the frame at ~1 second with ffmpeg, scaled to fit width x height
+    
+    Seeking before -i lets ffmpeg jump to the nearest keyframe instead of
+    decoding from the start. Returns JPEG bytes, or None if no frame came out.
+    Raises OSError if ffmpeg can't be run and TimeoutExpired if it hangs.
+    """
+    result = subprocess.run([
+        get_ffmpeg_path(), "-loglevel", "quiet",
+        "-ss", "1", "-i", str(video_path),
+        "-frames:v", "1",
+        "-vf", f"scale={width}:{height}:force_original_aspect_ratio=decrease",
+        "-f", "image2pipe", "-vcodec", "mjpeg", "-"
+    ], capture_output=True, timeout=5, creationflags=SUBPROCESS_FLAGS)
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout
+
+
+CLIP_THUMB_NAME = ".thumb.jpg"  # Thumbnail cached next to each clip's master.mp4
+CLIP_THUMB_SIZE = (140, 80)
+
+
+def load_clip_thumbnail(video_path, size=CLIP_THUMB_SIZE, fresh=None):
+    """Load a clip thumbnail fitted to size, extracting and caching it when needed
+    
+    fresh tells whether the cached file is at least as new as the video
+    (checked here when None). Returns None if ffmpeg produced no frame and
+    raises like extract_thumbnail_jpeg if it can't be run.
+    """
+    video_path = Path(video_path)
+    thumb_path = video_path.parent / CLIP_THUMB_NAME
+    
+    def fit(img):
+        if img.width > size[0] or img.height > size[1]:
+            img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        return img
+    
+    try:
+        if fresh is None:
+            fresh = thumb_path.stat().st_mtime >= video_path.stat().st_mtime
+        if fresh:
+            return fit(decode_jpeg(thumb_path.read_bytes(), size))
+    except OSError:
+        pass  # Missing or unreadable cached thumbnail - decode the video
+    
+    jpeg = extract_thumbnail_jpeg(video_path, *CLIP_THUMB_SIZE)
+    if not jpeg:
+        return None
+    try:
+        thumb_path.write_bytes(jpeg)
+    except OSError:
+        pass  # Read-only folder - just skip caching
+    return fit(decode_jpeg(jpeg, size))
+
+
 def get_ffmpeg_path():
     """Get FFmpeg executable path
     
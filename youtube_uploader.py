@@ -4,20 +4,16 @@ YouTube Uploader - Upload videos to YouTube using OAuth2
 
 import os
 import sys
+import re
 import json
-import pickle
-import webbrowser
+import time
+import random
+import socket
+import ssl
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
-
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from googleapiclient.errors import HttpError
 
 # YouTube API scopes
 SCOPES = [
@@ -36,13 +32,64 @@ else:
 CLIENT_SECRET_FILE = APP_DIR / "client_secret.json"
 CREDENTIALS_FILE = APP_DIR / "youtube_credentials.json"
 
+# Parse GPT replies with orjson when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+INSERT_PARTS = 'snippet,status'  # Resource parts set in the videos.insert body
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Bytes per resumable upload request
+MAX_VIDEO_SIZE = 256 * 1024 ** 3  # YouTube's upload size limit
+MAX_TITLE_LENGTH = 100
+MAX_DESCRIPTION_LENGTH = 5000
+MAX_SEO_TAGS = 15
+_EMPTY_TAGS = ()  # Shared stand-in for "no tags"
+MAX_CHUNK_RETRIES = 6  # Attempts per chunk before the upload is abandoned
+RETRIABLE_STATUS_CODES = (500, 502, 503, 504)
+HTTP_TIMEOUT = 120  # Seconds before a stalled API/upload request is dropped
+ERROR_BODY_LIMIT = 512  # Bytes of an API error response shown to the user
+
+
+def _probe_video(video_path: str) -> str:
+    """Check a video file before opening an upload session and return its MIME type"""
+    size = os.stat(video_path).st_size
+    if size == 0:
+        raise ValueError("Video file is empty")
+    if size > MAX_VIDEO_SIZE:
+        raise ValueError("Video file exceeds YouTube's 256 GB limit")
+    
+    with open(video_path, 'rb') as f:
+        header = f.read(12)
+    # MP4/MOV files start with an ftyp box; anything else is left for YouTube to sniff
+    return 'video/mp4' if header[4:8] == b'ftyp' else 'application/octet-stream'
+
+
+def _build_youtube(credentials):
+    """Build a YouTube API client on its own keep-alive HTTP connection"""
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+    from googleapiclient.http import build_http
+    
+    # build_http() stops httplib2 treating resumable uploads' 308 "Resume Incomplete" as a redirect
+    http = build_http()
+    http.timeout = HTTP_TIMEOUT
+    # Use the discovery document bundled with the client library instead of fetching it
+    return build('youtube', 'v3', http=AuthorizedHttp(credentials, http=http),
+        static_discovery=True, cache_discovery=False)
+
 
 class YouTubeUploader:
     """Handle YouTube OAuth and video uploads"""
     
     def __init__(self, status_callback=None):
         self.credentials = None
+        self._credentials_mtime = None  # mtime of the credentials file self.credentials was loaded from
+        self._credentials_json = None  # Last credentials JSON read from or written to the file
         self.youtube = None
+        self._youtube_credentials = None  # Credentials self.youtube was built with
+        self._local = threading.local()  # Per-thread API clients for upload_videos()
         self.channel_info = None
         self.status_callback = status_callback or (lambda msg: print(msg))
     
@@ -52,11 +99,20 @@ class YouTubeUploader:
     
     def is_authenticated(self) -> bool:
         """Check if we have valid credentials"""
-        if not CREDENTIALS_FILE.exists():
+        try:
+            mtime = CREDENTIALS_FILE.stat().st_mtime
+        except OSError:
             return False
         
+        from google.oauth2.credentials import Credentials
+        from google.auth.transport.requests import Request
+        
         try:
-            self.credentials = Credentials.from_authorized_user_file(str(CREDENTIALS_FILE), SCOPES)
+            # Only re-parse the file when it changed since it was last loaded
+            if self.credentials is None or mtime != self._credentials_mtime:
+                self.credentials = Credentials.from_authorized_user_file(str(CREDENTIALS_FILE), SCOPES)
+                self._credentials_mtime = mtime
+                self._credentials_json = self.credentials.to_json()
             if self.credentials and self.credentials.valid:
                 return True
             if self.credentials and self.credentials.expired and self.credentials.refresh_token:
@@ -69,15 +125,26 @@ class YouTubeUploader:
         return False
     
     def _save_credentials(self):
-        """Save credentials to file"""
-        with open(CREDENTIALS_FILE, 'w') as f:
-            f.write(self.credentials.to_json())
+        """Save credentials to file (skipped when nothing changed)"""
+        data = self.credentials.to_json()
+        if data == self._credentials_json and CREDENTIALS_FILE.exists():
+            return
+        
+        # Write a temp file and swap it in so a crash can't leave a truncated file
+        tmp_file = CREDENTIALS_FILE.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(data)
+        os.replace(tmp_file, CREDENTIALS_FILE)
+        self._credentials_json = data
+        self._credentials_mtime = CREDENTIALS_FILE.stat().st_mtime
     
     def authenticate(self, callback=None):
         """Start OAuth flow - opens browser for user to login"""
         if not self.is_configured():
             raise Exception("client_secret.json not found. Please set up YouTube API credentials.")
         
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        
         try:
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(CLIENT_SECRET_FILE),
@@ -124,12 +191,16 @@ class YouTubeUploader:
             raise
     
     def _init_youtube(self):
-        """Initialize YouTube API client"""
+        """Initialize YouTube API client (reused while the credentials stay the same)"""
         if not self.credentials:
             if not self.is_authenticated():
                 raise Exception("Not authenticated")
         
-        self.youtube = build('youtube', 'v3', credentials=self.credentials)
+        if self.youtube is not None and self._youtube_credentials is self.credentials:
+            return
+        
+        self.youtube = _build_youtube(self.credentials)
+        self._youtube_credentials = self.credentials
     
     def _get_channel_info(self):
         """Get authenticated user's channel info"""
@@ -172,9 +243,16 @@ class YouTubeUploader:
         if CREDENTIALS_FILE.exists():
             CREDENTIALS_FILE.unlink()
         self.credentials = None
+        self._credentials_mtime = None
+        self._credentials_json = None
         self.youtube = None
+        self._youtube_credentials = None
         self.channel_info = None
     
+    def _status(self, msg: str):
+        """Report upload status, via the current upload_videos job's callback if there is one"""
+        (getattr(self._local, 'status_callback', None) or self.status_callback)(msg)
+    
     def upload_video(
         self,
         video_path: str,
@@ -184,7 +262,8 @@ class YouTubeUploader:
         category_id: str = "22",  # 22 = People & Blogs
         privacy_status: str = "private",
         publish_at: str = None,  # ISO 8601 format: "2024-12-25T10:00:00Z"
-        progress_callback=None
+        progress_callback=None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE
     ) -> dict:
         """
         Upload video to YouTube
@@ -198,17 +277,36 @@ class YouTubeUploader:
             privacy_status: 'private', 'unlisted', or 'public'
             publish_at: Schedule publish time in ISO 8601 format (UTC)
             progress_callback: Function to call with upload progress (0-100)
+            chunk_size: Bytes sent per resumable request (-1 = whole file in one request)
         
         Returns:
             dict with video_id and url on success
         """
-        if not self.youtube:
-            self._init_youtube()
+        from googleapiclient.http import MediaIoBaseUpload
+        from googleapiclient.errors import HttpError
+        
+        try:
+            mimetype = _probe_video(video_path)
+        except (OSError, ValueError) as e:
+            error_msg = f"Upload error: {e}"
+            self._status(error_msg)
+            return {
+                'success': False,
+                'error': error_msg
+            }
+        
+        youtube = getattr(self._local, 'youtube', None)
+        if youtube is None:
+            if not self.youtube:
+                self._init_youtube()
+            youtube = self.youtube
         
         # Validate inputs
-        title = title[:100]  # YouTube max title length
-        description = description[:5000]  # YouTube max description length
-        tags = tags or []
+        if len(title) > MAX_TITLE_LENGTH:
+            title = title[:MAX_TITLE_LENGTH]
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            description = description[:MAX_DESCRIPTION_LENGTH]
+        tags = tags or _EMPTY_TAGS
         
         body = {
             'snippet': {
@@ -229,42 +327,48 @@ class YouTubeUploader:
             # Must be private if scheduled
             if privacy_status != 'private':
                 body['status']['privacyStatus'] = 'private'
-                self.status_callback("Note: Scheduled videos must be private initially")
+                self._status("Note: Scheduled videos must be private initially")
         
-        # Create media upload
-        media = MediaFileUpload(
-            video_path,
-            mimetype='video/mp4',
+        # Create media upload over our own buffered handle so it is closed when the upload ends.
+        # MediaIoBaseUpload streams each chunk from this handle in small reads, so no
+        # chunk-sized bytes object is built per request; the buffer is the file's own.
+        video_file = open(video_path, 'rb', buffering=chunk_size if chunk_size > 0 else -1)
+        media = MediaIoBaseUpload(
+            video_file,
+            mimetype=mimetype,
             resumable=True,
-            chunksize=1024*1024  # 1MB chunks
+            chunksize=chunk_size
         )
         
         try:
             if publish_at:
-                self.status_callback(f"Scheduling upload for: {publish_at}")
+                self._status(f"Scheduling upload for: {publish_at}")
             else:
-                self.status_callback(f"Starting upload: {title}")
+                self._status(f"Starting upload: {title}")
             
-            request = self.youtube.videos().insert(
-                part=','.join(body.keys()),
+            request = youtube.videos().insert(
+                part=INSERT_PARTS,
                 body=body,
                 media_body=media
             )
             
             response = None
+            last_progress = -1
             while response is None:
-                status, response = request.next_chunk()
+                status, response = self._next_chunk(request)
                 if status and progress_callback:
                     progress = int(status.progress() * 100)
-                    progress_callback(progress)
+                    if progress != last_progress:
+                        last_progress = progress
+                        progress_callback(progress)
             
             video_id = response['id']
             video_url = f"https://youtube.com/shorts/{video_id}"
             
             if publish_at:
-                self.status_callback(f"Video scheduled successfully: {video_url}")
+                self._status(f"Video scheduled successfully: {video_url}")
             else:
-                self.status_callback(f"Upload complete: {video_url}")
+                self._status(f"Upload complete: {video_url}")
             
             return {
                 'success': True,
@@ -275,22 +379,106 @@ class YouTubeUploader:
             }
             
         except HttpError as e:
-            error_msg = f"YouTube API error: {e.resp.status} - {e.content.decode()}"
-            self.status_callback(error_msg)
+            detail = e.content[:ERROR_BODY_LIMIT].decode('utf-8', errors='replace') if e.content else ''
+            error_msg = f"YouTube API error: {e.resp.status} - {detail}"
+            self._status(error_msg)
             return {
                 'success': False,
                 'error': error_msg
             }
         except Exception as e:
             error_msg = f"Upload error: {str(e)}"
-            self.status_callback(error_msg)
+            self._status(error_msg)
             return {
                 'success': False,
                 'error': error_msg
             }
+        finally:
+            video_file.close()
+    
+    def _next_chunk(self, request):
+        """Send the next chunk, resuming the session with backoff on transient errors"""
+        import httplib2
+        from googleapiclient.errors import HttpError
+        
+        for attempt in range(MAX_CHUNK_RETRIES):
+            try:
+                return request.next_chunk()
+            except HttpError as e:
+                if e.resp.status not in RETRIABLE_STATUS_CODES or attempt == MAX_CHUNK_RETRIES - 1:
+                    raise
+                error = f"HTTP {e.resp.status}"
+            except (socket.error, ssl.SSLError, httplib2.HttpLib2Error) as e:
+                if attempt == MAX_CHUNK_RETRIES - 1:
+                    raise
+                error = str(e) or type(e).__name__
+            
+            delay = 2 ** attempt + random.random()
+            self._status(f"Upload interrupted ({error}), retrying in {delay:.0f}s...")
+            time.sleep(delay)
+    
+    def upload_videos(self, jobs: list, max_workers: int = 3) -> list:
+        """
+        Upload several videos concurrently
+        
+        Status and progress callbacks are not called from the worker threads:
+        they are queued and run one at a time on the thread that called
+        upload_videos, and status messages are prefixed with the job's title.
+        Callers that update Tk must still hop to the UI thread themselves.
+        
+        Args:
+            jobs: List of dicts with upload_video keyword arguments
+            max_workers: Maximum number of uploads in flight
+        
+        Returns:
+            List of upload_video results, in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        self._init_youtube()
+        credentials = self.credentials
+        
+        events = queue.Queue()  # (callback, arg) from workers; None when a job finishes
+        
+        def run(job):
+            # httplib2 connections are not thread-safe, so each worker builds its own client
+            if getattr(self._local, 'youtube', None) is None:
+                self._local.youtube = _build_youtube(credentials)
+            
+            tag = job.get('title', '')[:40]
+            self._local.status_callback = lambda msg: events.put((self.status_callback, f"[{tag}] {msg}"))
+            progress_callback = job.get('progress_callback')
+            if progress_callback:
+                job = {**job, 'progress_callback': lambda p: events.put((progress_callback, p))}
+            try:
+                return self.upload_video(**job)
+            finally:
+                events.put(None)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs))),
+                                thread_name_prefix="yt-upload") as pool:
+            futures = [pool.submit(run, job) for job in jobs]
+            remaining = len(futures)
+            while remaining:
+                event = events.get()
+                if event is None:
+                    remaining -= 1
+                else:
+                    callback, arg = event
+                    callback(arg)
+            return [future.result() for future in futures]
+
+
+_FENCE_OPEN = re.compile(r"```json?\n?")
+_FENCE_CLOSE = re.compile(r"```\n?")
+
+_seo_cache = {}  # (clip_title, hook_text, model) -> generated metadata
+SEO_CACHE_MAX = 512
 
 
-def generate_seo_metadata(client, clip_title: str, hook_text: str, model: str = "gpt-4.1", temperature: float = 1.0) -> dict:
+def generate_seo_metadata(client, clip_title: str, hook_text: str, model: str = "gpt-4.1", temperature: float = 1.0,
+                          use_cache: bool = True, use_llm: bool = True) -> dict:
     """
     Generate SEO-optimized title and description using GPT
     
@@ -299,10 +487,20 @@ def generate_seo_metadata(client, clip_title: str, hook_text: str, model: str =
         clip_title: Original clip title
         hook_text: Hook text from the clip
         model: GPT model to use
+        use_cache: Return a previous result for the same clip and model instead of calling GPT again
+        use_llm: False to skip GPT and return basic metadata (cached results are still used)
     
     Returns:
         dict with title, description, tags
     """
+    cache_key = (clip_title, hook_text, model)
+    if use_cache and cache_key in _seo_cache:
+        cached = _seo_cache[cache_key]
+        return {**cached, 'tags': list(cached['tags'])}
+    
+    if not use_llm:
+        return _fallback_seo(clip_title, hook_text)
+    
     prompt = f"""Kamu adalah expert YouTube SEO untuk konten short-form (Shorts/Reels/TikTok).
 
 Berdasarkan informasi clip berikut, buatkan:
@@ -336,27 +534,138 @@ Return HANYA JSON, tanpa text lain."""
             temperature=temperature
         )
         
-        result = response.choices[0].message.content.strip()
-        
-        # Parse JSON
-        if result.startswith("```"):
-            import re
-            result = re.sub(r"```json?\n?", "", result)
-            result = re.sub(r"```\n?", "", result)
-        
-        metadata = json.loads(result)
-        
-        # Validate lengths
-        metadata['title'] = metadata.get('title', clip_title)[:100]
-        metadata['description'] = metadata.get('description', '')[:5000]
-        metadata['tags'] = metadata.get('tags', [])[:15]
-        
+        metadata = _validate_seo(_parse_gpt_json(response.choices[0].message.content), clip_title)
+        _remember_seo(cache_key, metadata)
         return metadata
         
     except Exception as e:
-        # Fallback to basic metadata
-        return {
-            'title': f"🔥 {clip_title}"[:100],
-            'description': f"{hook_text}\n\n#shorts #viral #fyp #podcast",
-            'tags': ['shorts', 'viral', 'fyp', 'podcast', 'indonesia']
-        }
+        return _fallback_seo(clip_title, hook_text)
+
+
+def generate_seo_metadata_batch(client, clips: list, model: str = "gpt-4.1", temperature: float = 1.0,
+                                use_cache: bool = True, use_llm: bool = True) -> list:
+    """
+    Generate SEO metadata for several clips with a single GPT request
+    
+    Args:
+        client: OpenAI client
+        clips: List of dicts with 'title' and 'hook_text'
+        model: GPT model to use
+        use_cache: Reuse previous results for clips that were already generated
+        use_llm: False to skip GPT and use basic metadata for clips not in the cache
+    
+    Returns:
+        List of dicts with title, description, tags, in the same order as clips
+    """
+    results = [None] * len(clips)
+    pending = []
+    for i, clip in enumerate(clips):
+        cache_key = (clip['title'], clip['hook_text'], model)
+        if use_cache and cache_key in _seo_cache:
+            cached = _seo_cache[cache_key]
+            results[i] = {**cached, 'tags': list(cached['tags'])}
+        else:
+            pending.append(i)
+    
+    if not use_llm:
+        for i in pending:
+            results[i] = _fallback_seo(clips[i]['title'], clips[i]['hook_text'])
+        return results
+    
+    if not pending:
+        return results
+    
+    items = json.dumps(
+        [{"judul": clips[i]['title'], "hook": clips[i]['hook_text']} for i in pending],
+        ensure_ascii=False, indent=2
+    )
+    prompt = f"""Kamu adalah expert YouTube SEO untuk konten short-form (Shorts/Reels/TikTok).
+
+Untuk SETIAP clip di daftar berikut, buatkan:
+1. Title yang catchy dan SEO-friendly (max 100 karakter, include emoji)
+2. Description yang engaging dengan hashtags (max 500 karakter)
+3. Tags yang relevan (5-10 tags)
+
+Daftar Clip:
+{items}
+
+Format response dalam JSON array dengan urutan yang sama seperti daftar clip:
+[
+    {{
+        "title": "judul dengan emoji",
+        "description": "deskripsi dengan hashtags",
+        "tags": ["tag1", "tag2", "tag3"]
+    }}
+]
+
+PENTING:
+- Jumlah item harus sama dengan jumlah clip ({len(pending)})
+- Title harus under 100 karakter
+- Gunakan bahasa Indonesia
+- Include trending hashtags seperti #shorts #viral #fyp
+- Buat yang clickbait tapi tetap relevan
+
+Return HANYA JSON array, tanpa text lain."""
+    
+    generated = []
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature
+        )
+        generated = _parse_gpt_json(response.choices[0].message.content)
+        if not isinstance(generated, list):
+            generated = []
+    except Exception:
+        pass
+    
+    for n, i in enumerate(pending):
+        clip = clips[i]
+        try:
+            metadata = _validate_seo(generated[n], clip['title'])
+            _remember_seo((clip['title'], clip['hook_text'], model), metadata)
+        except Exception:
+            metadata = _fallback_seo(clip['title'], clip['hook_text'])
+        results[i] = metadata
+    
+    return results
+
+
+def _parse_gpt_json(result: str):
+    """Parse a JSON reply from GPT, dropping any markdown code fence"""
+    result = result.strip()
+    if result.startswith("```"):
+        result = _FENCE_CLOSE.sub("", _FENCE_OPEN.sub("", result))
+    return _loads(result)
+
+
+def _validate_seo(metadata: dict, clip_title: str) -> dict:
+    """Clamp generated metadata to YouTube's limits"""
+    title = metadata.get('title', clip_title)
+    if len(title) > MAX_TITLE_LENGTH:
+        title = title[:MAX_TITLE_LENGTH]
+    description = metadata.get('description', '')
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        description = description[:MAX_DESCRIPTION_LENGTH]
+    tags = metadata.get('tags', [])
+    if len(tags) > MAX_SEO_TAGS:
+        tags = tags[:MAX_SEO_TAGS]
+    metadata.update(title=title, description=description, tags=tags)
+    return metadata
+
+
+def _remember_seo(cache_key: tuple, metadata: dict):
+    """Store generated metadata in the SEO cache"""
+    if len(_seo_cache) >= SEO_CACHE_MAX:
+        _seo_cache.pop(next(iter(_seo_cache)))
+    _seo_cache[cache_key] = {**metadata, 'tags': list(metadata['tags'])}
+
+
+def _fallback_seo(clip_title: str, hook_text: str) -> dict:
+    """Basic metadata used when GPT generation fails"""
+    return {
+        'title': f"🔥 {clip_title}"[:MAX_TITLE_LENGTH],
+        'description': f"{hook_text}\n\n#shorts #viral #fyp #podcast",
+        'tags': ['shorts', 'viral', 'fyp', 'podcast', 'indonesia']
+    }